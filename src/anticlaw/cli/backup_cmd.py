@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 import click
@@ -56,20 +55,16 @@ def _instantiate_provider(name: str, config: dict):
 
 def _load_manifest(home: Path, provider_name: str) -> dict | None:
     """Load backup manifest for a provider."""
-    path = home / ".acl" / f"backup_manifest_{provider_name}.json"
-    if path.exists():
-        try:
-            return json.loads(path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
-            pass
-    return None
+    from anticlaw.providers.backup.manifest import load_manifest
+
+    return load_manifest(home, provider_name)
 
 
 def _save_manifest(home: Path, provider_name: str, manifest: dict) -> None:
     """Save backup manifest for a provider."""
-    path = home / ".acl" / f"backup_manifest_{provider_name}.json"
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    from anticlaw.providers.backup.manifest import save_manifest
+
+    save_manifest(home, provider_name, manifest)
 
 
 @click.group("backup")
@@ -60,6 +60,7 @@ def daemon_start(home: Path | None, no_tray: bool, no_watch: bool, no_schedule:
     watcher = None
     if not no_watch and daemon_cfg.get("watch", {}).get("enabled", True):
         try:
+            from anticlaw.daemon.journal import ChangeJournal
             from anticlaw.daemon.watcher import FileWatcher
 
             watch_cfg = daemon_cfg.get("watch", {})
@@ -67,6 +68,9 @@ def daemon_start(home: Path | None, no_tray: bool, no_watch: bool, no_schedule:
                 home=home_path,
                 debounce_seconds=watch_cfg.get("debounce_seconds", 2.0),
                 ignore_patterns=set(watch_cfg.get("ignore_patterns", [])) or None,
+                journal=(
+                    ChangeJournal(home_path) if watch_cfg.get("backup_journal", True) else None
+                ),
             )
             watcher.start()
             components.append("watcher")
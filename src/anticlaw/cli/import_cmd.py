@@ -308,7 +308,7 @@ def _create_project_with_meta(
             from anticlaw.providers.llm.claude import _parse_timestamp
 
             project.created = _parse_timestamp(meta.get("created_at"))
-            project.updated = _parse_timestamp(meta.get("updated_at")) or project.created
+            project.updated = _parse_timestamp(meta.get("updated_at"), project.created)
         project.providers = {"claude": {"remote_id": project_uuid}}
 
         # Save knowledge docs if present
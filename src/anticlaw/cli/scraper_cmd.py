@@ -6,6 +6,8 @@ from pathlib import Path
 
 import click
 
+from anticlaw.core.config import resolve_home
+
 
 @click.group("scrape")
 def scrape_group() -> None:
@@ -66,7 +68,7 @@ def scrape_claude(cdp_url: str, output: Path, home: Path | None) -> None:
     from anticlaw.core.fileutil import safe_filename
     from anticlaw.providers.scraper.claude import ClaudeScraper
 
-    scraper = ClaudeScraper(cdp_url=cdp_url)
+    scraper = ClaudeScraper(cdp_url=cdp_url, home=home or resolve_home())
     click.echo(f"Connecting to Chrome at {cdp_url}...")
 
     try:
@@ -120,6 +120,7 @@ DEFAULTS: dict = {
             "auto_project": "ask",
             "debounce_seconds": 2,
             "ignore_patterns": ["*.tmp", "*.swp", ".git/*"],
+            "backup_journal": True,
         },
         "backup": {
             "enabled": False,
@@ -19,6 +19,10 @@ DIR_MODE = 0o700
 
 _IS_WINDOWS = platform.system() == "Windows"
 
+# safe_filename: characters to drop, and runs of whitespace/hyphens to collapse
+_UNSAFE_CHARS = re.compile(r"[^\w\s\-.]")
+_SEPARATOR_RUNS = re.compile(r"[\s-]+")
+
 
 def safe_filename(title: str, max_length: int = 200) -> str:
     """Convert a title to a safe filename slug.
@@ -30,10 +34,9 @@ def safe_filename(title: str, max_length: int = 200) -> str:
     # Remove path traversal
     name = name.replace("..", "").replace("/", "-").replace("\\", "-")
     # Keep only safe chars: alphanumeric, hyphen, underscore, dot, space
-    name = re.sub(r"[^\w\s\-.]", "", name)
+    name = _UNSAFE_CHARS.sub("", name)
     # Collapse whitespace / hyphens
-    name = re.sub(r"[\s]+", "-", name)
-    name = re.sub(r"-+", "-", name)
+    name = _SEPARATOR_RUNS.sub("-", name)
     # Strip leading/trailing hyphens and dots
     name = name.strip("-.")
     # Lowercase
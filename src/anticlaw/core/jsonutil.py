@@ -0,0 +1,85 @@
+"""JSON helpers: orjson/ijson when installed, stdlib json otherwise."""
+
+from __future__ import annotations
+
+import itertools
+import json
+from collections.abc import Iterator
+from typing import IO, Any
+
+# Dependency guard
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Dependency guard — ijson parses large arrays one item at a time
+try:
+    import ijson
+
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse a JSON document from bytes or str.
+
+    Raises ``json.JSONDecodeError`` (a ``ValueError``) on invalid input with
+    either backend.
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects lone surrogate escapes ("\udcff") that stdlib
+            # json writes for undecodable filenames; let stdlib decide
+            pass
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON bytes, non-ASCII kept as-is.
+
+    With ``indent`` the output uses two-space indentation, the same layout
+    as ``json.dumps(obj, indent=2)``.
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+        except orjson.JSONEncodeError:
+            # Lone surrogates and non-str keys: let stdlib decide
+            pass
+    options: dict[str, Any] = {"indent": 2} if indent else {"separators": (",", ":")}
+    try:
+        return json.dumps(obj, ensure_ascii=False, **options).encode("utf-8")
+    except UnicodeEncodeError:
+        # Lone surrogates cannot be UTF-8; write them as \u escapes instead
+        return json.dumps(obj, **options).encode("ascii")
+
+
+def iter_array(stream: IO[bytes]) -> Iterator[Any]:
+    """Yield the items of a top-level JSON array read from a binary stream.
+
+    With ijson installed the stream is parsed incrementally, so only one
+    item is held in memory at a time; otherwise the whole document is
+    parsed with loads(). Raises ``ValueError`` if the document is not a
+    JSON array or is malformed.
+    """
+    if not HAS_IJSON:
+        items = loads(stream.read())
+        if not isinstance(items, list):
+            raise ValueError("Expected a JSON array")
+        yield from items
+        return
+
+    try:
+        events = ijson.parse(stream, use_float=True)
+        first = next(events, None)
+        if first is None or first[1] != "start_array":
+            raise ValueError("Expected a JSON array")
+        yield from ijson.items(itertools.chain([first], events), "item")
+    except ijson.JSONError as e:
+        raise ValueError(f"Invalid JSON: {e}") from e
@@ -265,6 +265,20 @@ class MetaDB:
             ).fetchall()
         return [dict(r) for r in rows]
 
+    def count_projects(self) -> int:
+        """Count indexed projects."""
+        row = self.conn.execute(
+            "SELECT COUNT(*) as cnt FROM projects"
+        ).fetchone()
+        return row["cnt"] if row else 0
+
+    def count_chats(self) -> int:
+        """Count indexed chats."""
+        row = self.conn.execute(
+            "SELECT COUNT(*) as cnt FROM chats"
+        ).fetchone()
+        return row["cnt"] if row else 0
+
     # --- Updates ---
 
     def update_chat_tags(self, chat_id: str, tags: list[str]) -> None:
@@ -52,7 +52,7 @@ def _uuid() -> str:
 # --- Core Models ---
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatMessage:
     """A single message in a chat conversation."""
 
@@ -150,7 +150,7 @@ class RemoteChat:
     message_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatData:
     """Full chat data exported from a provider, ready for local storage."""
 
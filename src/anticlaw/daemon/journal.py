@@ -0,0 +1,144 @@
+"""Change journal — paths touched under ACL_HOME while the daemon watches.
+
+Incremental backups read it to check only the files that changed since the
+last backup instead of walking and stat'ing the whole knowledge base.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import TextIO
+
+from anticlaw.daemon.service import is_process_running
+
+log = logging.getLogger(__name__)
+
+# Kept under .acl so the watcher never journals its own writes
+_JOURNAL_NAME = "backup_journal.log"
+
+# Past this many entries the journal restarts, so the next backup walks the tree
+_MAX_ENTRIES = 100_000
+
+# Paths inside these directories are never recorded
+_SKIP_DIRS = {".acl"}
+
+
+def journal_path(home: Path) -> Path:
+    """Return the change journal path for a knowledge base."""
+    return home / ".acl" / _JOURNAL_NAME
+
+
+class ChangeJournal:
+    """Append-only log of changed paths, relative to ACL_HOME.
+
+    The first line is a JSON header with the start time and the writer's
+    PID; every other line is ``<unix time>\\t<relative path>``, with a
+    trailing separator for directory events. A journal is only trusted
+    (see read_changes()) while its writer is alive and if it started
+    before the backup it is compared against.
+    """
+
+    def __init__(self, home: Path, max_entries: int = _MAX_ENTRIES) -> None:
+        self.home = home
+        self.path = journal_path(home)
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._file: TextIO | None = None
+        self._entries = 0
+
+    def start(self) -> None:
+        """Begin a fresh journal, discarding any previous one."""
+        with self._lock:
+            self._reset()
+
+    def close(self) -> None:
+        """Stop journaling and delete the file — changes are no longer tracked."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            with contextlib.suppress(OSError):
+                self.path.unlink()
+
+    def record(self, path: str, is_directory: bool = False) -> None:
+        """Append an absolute *path* reported by the watcher."""
+        try:
+            rel_path = os.path.relpath(path, self.home)
+        except ValueError:
+            return  # different drive on Windows
+        if rel_path == os.curdir:
+            if is_directory:
+                # Anything under ACL_HOME may have changed: restart so the
+                # next backup walks
+                with self._lock:
+                    if self._file is not None:
+                        log.info("Change journal restarted: ACL_HOME changed")
+                        self._reset()
+            return
+        if rel_path.split(os.sep)[0] == os.pardir:
+            return
+        if not _SKIP_DIRS.isdisjoint(rel_path.split(os.sep)):
+            return
+
+        with self._lock:
+            if self._file is None:
+                return
+            if "\n" in rel_path or self._entries >= self._max_entries:
+                # Can't represent this change: restart so the next backup walks
+                log.info("Change journal restarted after %d entries", self._entries)
+                self._reset()
+                return
+            suffix = os.sep if is_directory else ""
+            self._file.write(f"{time.time():.3f}\t{rel_path}{suffix}\n")
+            self._entries += 1
+
+    def _reset(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        header = json.dumps({"started": time.time(), "pid": os.getpid()})
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        tmp_path.write_text(header + "\n", encoding="utf-8")
+        os.replace(tmp_path, self.path)
+        self._file = open(  # noqa: SIM115
+            self.path, "a", encoding="utf-8", errors="surrogateescape",
+            newline="\n", buffering=1,
+        )
+        self._entries = 0
+
+
+def read_changes(home: Path, since: float) -> set[str] | None:
+    """Relative paths changed at or after *since* (Unix time), per the journal.
+
+    Directory entries keep their trailing separator. Returns None when the
+    journal can't vouch for every change since *since* — it is missing or
+    unreadable, started later, its writer has exited, or a line is being
+    written — in which case the caller must walk the tree.
+    """
+    try:
+        with open(
+            journal_path(home), encoding="utf-8", errors="surrogateescape", newline="\n",
+        ) as f:
+            header = json.loads(f.readline())
+            if float(header["started"]) > since:
+                return None
+            pid = int(header["pid"])
+            if pid != os.getpid() and not is_process_running(pid):
+                return None
+
+            changes: set[str] = set()
+            for line in f:
+                if not line.endswith("\n"):
+                    return None
+                ts, sep, rel_path = line[:-1].partition("\t")
+                if sep and float(ts) >= since:
+                    changes.add(rel_path)
+            return changes
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
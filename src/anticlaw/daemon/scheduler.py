@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import contextlib
 import json
 import logging
 import time
@@ -307,18 +306,11 @@ class TaskScheduler:
         else:
             return f"Unknown backup provider: {provider_name}"
 
-        # Load manifest
-        manifest_path = self.home / ".acl" / f"backup_manifest_{provider_name}.json"
-        manifest = None
-        if manifest_path.exists():
-            with contextlib.suppress(json.JSONDecodeError, OSError):
-                manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        from anticlaw.providers.backup.manifest import load_manifest, save_manifest
 
+        manifest = load_manifest(self.home, provider_name)
         result, new_manifest = provider.backup(self.home, manifest)
-
-        # Save updated manifest
-        manifest_path.parent.mkdir(parents=True, exist_ok=True)
-        manifest_path.write_text(json.dumps(new_manifest, indent=2), encoding="utf-8")
+        save_manifest(self.home, provider_name, new_manifest)
 
         if result.success:
             return f"{result.files_copied} copied, {result.files_skipped} skipped"
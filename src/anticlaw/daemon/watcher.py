@@ -6,6 +6,10 @@ import logging
 import threading
 import time
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from anticlaw.daemon.journal import ChangeJournal
 
 log = logging.getLogger(__name__)
 
@@ -15,13 +19,17 @@ _DEFAULT_DEBOUNCE = 2.0
 # Default patterns to ignore
 _DEFAULT_IGNORE = {"*.tmp", "*.swp", "*.swx", ".git", ".acl", "__pycache__"}
 
+# Watchdog event types that change what a backup would copy
+_JOURNAL_EVENTS = {"created", "modified", "deleted", "moved"}
+
 
 class FileWatcher:
     """Watch ACL_HOME for .md file changes and trigger reindex.
 
     Uses watchdog for cross-platform file monitoring. Debounces rapid
     changes so that multiple saves within the debounce window produce
-    a single reindex.
+    a single reindex. With a ChangeJournal, every file change (not just
+    .md) is also journaled for incremental backups while watching.
     """
 
     def __init__(
@@ -30,11 +38,13 @@ class FileWatcher:
         debounce_seconds: float = _DEFAULT_DEBOUNCE,
         ignore_patterns: set[str] | None = None,
         on_change: object | None = None,
+        journal: ChangeJournal | None = None,
     ) -> None:
         self.home = home
         self.debounce = debounce_seconds
         self.ignore_patterns = ignore_patterns or _DEFAULT_IGNORE
         self._on_change = on_change  # callback(event_type, path)
+        self._journal = journal
         self._observer = None
         self._pending: dict[str, tuple[str, float]] = {}  # path -> (event, time)
         self._lock = threading.Lock()
@@ -54,12 +64,16 @@ class FileWatcher:
         self._observer = Observer()
         self._observer.schedule(handler, str(self.home), recursive=True)
         self._observer.start()
+        if self._journal is not None:
+            self._journal.start()
         self._running = True
         log.info("FileWatcher started: %s", self.home)
 
     def stop(self) -> None:
         """Stop watching."""
         self._running = False
+        if self._journal is not None:
+            self._journal.close()
         if self._timer is not None:
             self._timer.cancel()
             self._timer = None
@@ -89,6 +103,17 @@ class FileWatcher:
 
         return False
 
+    def _record_change(self, event) -> None:
+        """Journal a raw watchdog event for the next incremental backup."""
+        if self._journal is None or event.event_type not in _JOURNAL_EVENTS:
+            return
+        # A directory "modified" event is journaled too: some backends report
+        # lost events that way, and the backup then rechecks the directory
+        self._journal.record(event.src_path, event.is_directory)
+        dest_path = getattr(event, "dest_path", "")
+        if dest_path:
+            self._journal.record(dest_path, event.is_directory)
+
     def _on_fs_event(self, event_type: str, src_path: str) -> None:
         """Called by the watchdog handler. Debounces and filters."""
         if self._should_ignore(src_path):
@@ -250,6 +275,7 @@ class _ChangeHandler:
 
     def dispatch(self, event) -> None:
         """Dispatch all watchdog events."""
+        self._watcher._record_change(event)
         if event.is_directory:
             return
 
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import codecs
 import json
 import logging
 import re
+from array import array
+from collections.abc import Iterator
 from pathlib import Path
 
 log = logging.getLogger(__name__)
@@ -13,7 +16,8 @@ log = logging.getLogger(__name__)
 class ContextStore:
     """Stores large content as named variables on disk.
 
-    Content is saved to .acl/contexts/<name>.txt with JSON metadata sidecars.
+    Content is saved to .acl/contexts/<name>.txt with JSON metadata sidecars
+    and a binary line-offset index (<name>.idx) for O(1) line-range seeks.
     Supports 6 chunking strategies: auto, lines, paragraphs, headings, chars, regex.
     """
 
@@ -27,14 +31,46 @@ class ContextStore:
     def _meta_path(self, name: str) -> Path:
         return self.dir / f"{name}.json"
 
+    def _index_path(self, name: str) -> Path:
+        return self.dir / f"{name}.idx"
+
     def _chunks_dir(self, name: str) -> Path:
         return self.dir / f"{name}_chunks"
 
+    # --- Line-offset index ---
+
+    @staticmethod
+    def _build_offsets(data: bytes) -> array:
+        """Byte offset of the start of every line in *data*."""
+        offsets = array("Q", [0])
+        pos = data.find(b"\n")
+        while pos != -1:
+            offsets.append(pos + 1)
+            pos = data.find(b"\n", pos + 1)
+        return offsets
+
+    def _load_offsets(self, name: str) -> array:
+        """Load the line-offset index, rebuilding it if missing or stale."""
+        index_path = self._index_path(name)
+        content_path = self._content_path(name)
+        offsets = array("Q")
+        if index_path.exists() and index_path.stat().st_mtime >= content_path.stat().st_mtime:
+            offsets.frombytes(index_path.read_bytes())
+            if offsets:
+                return offsets
+        offsets = self._build_offsets(content_path.read_bytes())
+        index_path.write_bytes(offsets.tobytes())
+        return offsets
+
     # --- CRUD ---
 
     def save(self, name: str, content: str, content_type: str = "text") -> dict:
         """Save content as a named variable. Returns metadata."""
-        self._content_path(name).write_text(content, encoding="utf-8")
+        # Store "\n" line endings, as reading back in text mode would return
+        # them, so ranged reads split lines the same way get() does
+        data = content.replace("\r\n", "\n").replace("\r", "\n").encode("utf-8")
+        self._content_path(name).write_bytes(data)
+        self._index_path(name).write_bytes(self._build_offsets(data).tobytes())
 
         lines = content.count("\n") + 1
         chars = len(content)
@@ -77,18 +113,56 @@ class ContextStore:
         if not content_path.exists():
             return f"Context '{name}' not found"
 
-        content = content_path.read_text(encoding="utf-8")
         if start_line is not None or end_line is not None:
-            lines = content.split("\n")
-            start = (start_line or 1) - 1
-            end = end_line or len(lines)
-            return "\n".join(lines[start:end])
-        return content
+            return "".join(self.iter_range(name, start_line, end_line))
+        return content_path.read_text(encoding="utf-8")
+
+    def iter_range(
+        self,
+        name: str,
+        start_line: int | None = None,
+        end_line: int | None = None,
+        buf: int = 64 * 1024,
+    ) -> Iterator[str]:
+        """Yield a line range (1-indexed, inclusive) in chunks of at most *buf* bytes.
+
+        Seeks straight to the first line via the offset index instead of
+        reading and splitting the whole file.
+        """
+        content_path = self._content_path(name)
+        if not content_path.exists():
+            return
+
+        offsets = self._load_offsets(name)
+        line_count = len(offsets)
+        start = (start_line or 1) - 1
+        end = end_line or line_count
+        start, end, _ = slice(start, end).indices(line_count)
+        if start >= end:
+            return
+
+        begin = offsets[start]
+        # Stop before the newline that terminates the last requested line
+        stop = offsets[end] - 1 if end < line_count else content_path.stat().st_size
+        remaining = stop - begin
+        with open(content_path, "rb") as f:
+            f.seek(begin)
+            decoder = codecs.getincrementaldecoder("utf-8")()
+            while remaining > 0:
+                data = f.read(min(buf, remaining))
+                if not data:
+                    break
+                remaining -= len(data)
+                text = decoder.decode(data, final=remaining <= 0)
+                if text:
+                    yield text
 
     def delete(self, name: str) -> bool:
         """Delete a stored context and its chunks."""
         deleted = False
-        for path in [self._content_path(name), self._meta_path(name)]:
+        for path in [
+            self._content_path(name), self._meta_path(name), self._index_path(name),
+        ]:
             if path.exists():
                 path.unlink()
                 deleted = True
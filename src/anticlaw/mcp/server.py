@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 from pathlib import Path
@@ -34,7 +35,9 @@ _tracker = TurnTracker()
 # --- Helpers ---
 
 
+@functools.cache
 def _get_home() -> Path:
+    """Resolve ACL_HOME once per server process."""
     return resolve_home()
 
 
@@ -67,15 +70,12 @@ def _with_reminder(result: str) -> str:
 def ping_impl(home: Path) -> dict:
     db = _get_db(home)
     try:
-        projects = db.list_projects()
-        chats = db.list_chats()
-        insights = db.count_insights()
         return {
             "status": "ok",
             "version": __version__,
-            "projects": len(projects),
-            "chats": len(chats),
-            "insights": insights,
+            "projects": db.count_projects(),
+            "chats": db.count_chats(),
+            "insights": db.count_insights(),
         }
     finally:
         db.close()
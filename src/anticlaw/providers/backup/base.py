@@ -30,6 +30,7 @@ class BackupInfo:
     supports_incremental: bool
     supports_restore: bool
     requires_auth: bool
+    supports_hardlinks: bool = False
 
 
 @runtime_checkable
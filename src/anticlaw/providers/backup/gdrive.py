@@ -17,6 +17,12 @@ log = logging.getLogger(__name__)
 # Directories to skip during backup
 _SKIP_DIRS = {".acl", ".git", ".github", "__pycache__"}
 
+# Retries for transient Drive API errors (5xx, rate limits, dropped connections)
+_NUM_RETRIES = 3
+
+# Socket timeout (seconds) for the shared HTTP transport
+_HTTP_TIMEOUT = 30
+
 
 def _md5(path: Path) -> str:
     """Compute MD5 hash of a file."""
@@ -51,10 +57,17 @@ class GDriveBackupProvider:
         )
 
     def _get_service(self):
-        """Lazy-initialize the Google Drive API service."""
+        """Lazy-initialize the Google Drive API service.
+
+        The service is built once per provider on a single authorized
+        ``httplib2.Http`` transport, so backup/restore/list/verify calls reuse
+        the same keep-alive connection instead of re-negotiating TLS.
+        """
         if self._service is not None:
             return self._service
         try:
+            import google_auth_httplib2
+            import httplib2
             import keyring
             from googleapiclient.discovery import build
 
@@ -68,7 +81,10 @@ class GDriveBackupProvider:
             from google.oauth2.credentials import Credentials
 
             creds = Credentials.from_authorized_user_info(json.loads(token_json))
-            self._service = build("drive", "v3", credentials=creds)
+            http = google_auth_httplib2.AuthorizedHttp(
+                creds, http=httplib2.Http(timeout=_HTTP_TIMEOUT),
+            )
+            self._service = build("drive", "v3", http=http, cache_discovery=False)
             return self._service
         except ImportError as e:
             raise RuntimeError(
@@ -80,7 +96,7 @@ class GDriveBackupProvider:
         """Verify Google Drive credentials."""
         try:
             service = self._get_service()
-            service.files().list(pageSize=1).execute()
+            service.files().list(pageSize=1).execute(num_retries=_NUM_RETRIES)
             return True
         except Exception as e:
             log.warning("GDrive auth failed: %s", e)
@@ -93,7 +109,9 @@ class GDriveBackupProvider:
             f"and mimeType='application/vnd.google-apps.folder' "
             f"and trashed=false"
         )
-        result = service.files().list(q=query, fields="files(id)").execute()
+        result = service.files().list(q=query, fields="files(id)").execute(
+            num_retries=_NUM_RETRIES,
+        )
         files = result.get("files", [])
         if files:
             return files[0]["id"]
@@ -103,7 +121,9 @@ class GDriveBackupProvider:
             "mimeType": "application/vnd.google-apps.folder",
             "parents": [parent_id],
         }
-        folder = service.files().create(body=metadata, fields="id").execute()
+        folder = service.files().create(body=metadata, fields="id").execute(
+            num_retries=_NUM_RETRIES,
+        )
         return folder["id"]
 
     def backup(
@@ -172,7 +192,7 @@ class GDriveBackupProvider:
                     metadata = {"name": fname, "parents": [parent_id]}
                     uploaded = service.files().create(
                         body=metadata, media_body=media, fields="id"
-                    ).execute()
+                    ).execute(num_retries=_NUM_RETRIES)
 
                     new_hashes[rel_path] = file_hash
                     new_file_ids[rel_path] = uploaded["id"]
@@ -239,7 +259,7 @@ class GDriveBackupProvider:
 
         result = service.files().list(
             q=query, orderBy="name desc", fields="files(id,name)", pageSize=1,
-        ).execute()
+        ).execute(num_retries=_NUM_RETRIES)
         folders = result.get("files", [])
         if not folders:
             return BackupResult(
@@ -279,7 +299,7 @@ class GDriveBackupProvider:
         query = f"'{folder_id}' in parents and trashed=false"
         result = service.files().list(
             q=query, fields="files(id,name,mimeType,size)",
-        ).execute()
+        ).execute(num_retries=_NUM_RETRIES)
 
         for item in result.get("files", []):
             if item["mimeType"] == "application/vnd.google-apps.folder":
@@ -292,7 +312,7 @@ class GDriveBackupProvider:
             else:
                 try:
                     request = service.files().get_media(fileId=item["id"])
-                    content = request.execute()
+                    content = request.execute(num_retries=_NUM_RETRIES)
                     dest = local_dir / item["name"]
                     dest.write_bytes(content)
                     copied += 1
@@ -316,7 +336,7 @@ class GDriveBackupProvider:
         )
         result = service.files().list(
             q=query, orderBy="name desc", fields="files(id,name,createdTime)",
-        ).execute()
+        ).execute(num_retries=_NUM_RETRIES)
 
         snapshots = []
         for item in result.get("files", []):
@@ -333,7 +353,7 @@ class GDriveBackupProvider:
         """Verify Google Drive backup folder exists and is accessible."""
         try:
             service = self._get_service()
-            service.files().get(fileId=self._folder_id).execute()
+            service.files().get(fileId=self._folder_id).execute(num_retries=_NUM_RETRIES)
             return True
         except Exception:
             return False
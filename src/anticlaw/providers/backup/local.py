@@ -1,22 +1,223 @@
-"""Local backup provider — shutil-based file copy with incremental manifest."""
+"""Local backup provider — file copy with incremental manifest."""
 
 from __future__ import annotations
 
 import contextlib
+import errno
+import hashlib
+import json
 import logging
 import os
 import shutil
 import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
+from stat import S_ISDIR
 
+from anticlaw.daemon.journal import read_changes
 from anticlaw.providers.backup.base import BackupInfo, BackupResult
 
+# Dependency guard — xxh3 is much faster; blake2b is the stdlib fallback
+try:
+    import xxhash
+
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
 log = logging.getLogger(__name__)
 
 # Directories to skip during backup
 _SKIP_DIRS = {".acl", ".git", ".github", "__pycache__"}
 
+# Snapshot IDs (and manifest "last_backup") are UTC timestamps in this format
+_TS_FORMAT = "%Y-%m-%dT%H-%M-%S"
+
+# Walk the whole tree at least this often, even with a change journal, so
+# events the watcher never saw (e.g. a dropped kernel queue) are caught
+_FULL_WALK_SECONDS = 24 * 3600
+
+# Below this many files, stat serially — thread startup would dominate
+_STAT_BATCH_MIN = 512
+
+# Worker threads for batched stat() calls
+_STAT_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+# copy_file_range is Linux-only (kernel >= 4.5); chunk so one call never exceeds ssize_t
+_HAS_COPY_FILE_RANGE = hasattr(os, "copy_file_range")
+_COPY_RANGE_CHUNK = 1 << 30
+
+# Errors meaning "copy_file_range can't do this copy" rather than a real I/O failure
+_COPY_RANGE_FALLBACK = {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP}
+
+# Per-snapshot summary sidecar (<snapshot>.summary.json), kept outside the
+# snapshot dir so restore() never copies it back into the knowledge base
+_SUMMARY_SUFFIX = ".summary.json"
+
+# Below this many files, copy serially
+_COPY_BATCH_MIN = 8
+
+# Worker threads for file copies (I/O-bound, copy2 releases the GIL)
+_COPY_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+
+
+def _iter_files(
+    root: str,
+    skip_dirs: set[str] | frozenset[str] = frozenset(),
+    rel_root: str = "",
+) -> Iterator[tuple[str, os.DirEntry]]:
+    """Recursively yield ``(rel_path, entry)`` for every file under *root*.
+
+    Uses ``os.scandir`` so file type checks come from the readdir result and
+    ``entry.stat()`` is cached per entry. Like ``os.walk``, symlinked
+    directories are not descended into and unreadable directories are skipped.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError as e:
+        log.warning("Cannot scan %s: %s", root, e)
+        return
+
+    for entry in entries:
+        rel_path = os.path.join(rel_root, entry.name) if rel_root else entry.name
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            if entry.name not in skip_dirs and not entry.is_symlink():
+                yield from _iter_files(entry.path, skip_dirs, rel_path)
+        else:
+            yield rel_path, entry
+
+
+def _stat_entry(entry: os.DirEntry | str) -> os.stat_result | OSError:
+    try:
+        return entry.stat() if isinstance(entry, os.DirEntry) else os.stat(entry)
+    except OSError as e:
+        return e
+
+
+def _stat_batch(entries: list[os.DirEntry] | list[str]) -> list[os.stat_result | OSError]:
+    """Stat many entries at once, returning a result or the error for each.
+
+    Large batches are spread over a thread pool: ``stat()`` releases the GIL,
+    so the metadata lookups overlap in the kernel instead of paying one
+    blocking round trip per file. Small batches are stat'ed serially.
+    """
+    if len(entries) < _STAT_BATCH_MIN:
+        return [_stat_entry(e) for e in entries]
+    with ThreadPoolExecutor(max_workers=_STAT_WORKERS) as pool:
+        return list(pool.map(_stat_entry, entries, chunksize=64))
+
+
+def _fast_copy(src: str, dst: str) -> None:
+    """Copy file data and metadata like ``shutil.copy2``.
+
+    On Linux the data is copied in-kernel with ``os.copy_file_range`` (which
+    can reflink on btrfs/XFS), skipping the userspace buffer. Filesystems or
+    kernels that reject it fall back to ``shutil.copyfile`` (``sendfile``).
+    """
+    if not _HAS_COPY_FILE_RANGE:
+        shutil.copy2(src, dst)
+        return
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+            while os.copy_file_range(in_fd, out_fd, _COPY_RANGE_CHUNK):
+                pass
+    except OSError as e:
+        if e.errno not in _COPY_RANGE_FALLBACK:
+            raise
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+def _content_hash(path: str) -> str:
+    """Fast 64-bit content hash (xxh3 when installed, blake2b otherwise)."""
+    h = xxhash.xxh3_64() if HAS_XXHASH else hashlib.blake2b(digest_size=8)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _make_parent_dirs(dst_paths: Iterable[str], created: set[str]) -> None:
+    """Create the parent dir of every destination once, skipping those in *created*.
+
+    Files are grouped by directory, so this replaces a makedirs() per file
+    with one per directory. A dir that can't be created is left to fail
+    the individual copies into it, which report the error per file.
+    """
+    for parent in sorted({os.path.dirname(p) for p in dst_paths} - created):
+        try:
+            os.makedirs(parent, exist_ok=True)
+        except OSError as e:
+            log.warning("Cannot create %s: %s", parent, e)
+            continue
+        created.add(parent)
+
+
+def _copy_file(job: tuple[str, str]) -> OSError | None:
+    """Copy one ``(src, dst)`` pair with metadata, returning the error if any.
+
+    The destination's parent dir must already exist (see _make_parent_dirs).
+    """
+    src, dst = job
+    try:
+        _fast_copy(src, dst)
+    except OSError as e:
+        return e
+    return None
+
+
+def _link_or_copy(existing: str, src: str, dst: str) -> OSError | None:
+    """Hardlink *dst* to an already-backed-up *existing* copy, or copy *src*."""
+    try:
+        try:
+            os.link(existing, dst)
+        except OSError:
+            # No hardlink support on the target filesystem — copy the data
+            _fast_copy(src, dst)
+    except OSError as e:
+        return e
+    return None
+
+
+def _ts_to_unix(ts: str) -> float:
+    """Unix time of a snapshot ID (_TS_FORMAT, UTC)."""
+    return datetime.strptime(ts, _TS_FORMAT).replace(tzinfo=timezone.utc).timestamp()
+
+
+def _inode_key(stat: os.stat_result) -> str:
+    return f"{stat.st_dev}:{stat.st_ino}"
+
+
+def _copy_batch(
+    jobs: list[tuple[str, str]],
+    created_dirs: set[str],
+) -> list[OSError | None]:
+    """Copy many files concurrently, returning the error (or None) for each job."""
+    _make_parent_dirs((dst for _src, dst in jobs), created_dirs)
+    if len(jobs) < _COPY_BATCH_MIN:
+        return [_copy_file(job) for job in jobs]
+    with ThreadPoolExecutor(max_workers=_COPY_WORKERS) as pool:
+        return list(pool.map(_copy_file, jobs))
+
+
+def _walk_summary(path: str) -> tuple[int, int]:
+    """Count files and bytes in a snapshot dir."""
+    file_count = 0
+    total_size = 0
+    for _rel_path, entry in _iter_files(path):
+        with contextlib.suppress(OSError):
+            total_size += entry.stat().st_size
+            file_count += 1
+    return file_count, total_size
+
 
 class LocalBackupProvider:
     """Backup to a local directory with timestamped snapshots."""
@@ -37,6 +238,7 @@ class LocalBackupProvider:
             supports_incremental=True,
             supports_restore=True,
             requires_auth=False,
+            supports_hardlinks=hasattr(os, "link"),
         )
 
     def auth(self, config: dict) -> bool:
@@ -52,22 +254,40 @@ class LocalBackupProvider:
         """Run incremental backup to local directory.
 
         Creates a timestamped snapshot directory. Only copies files that
-        changed since the last backup (by comparing mtime from manifest).
+        changed since the last backup: size and mtime must both match the
+        manifest to skip a file. When only the mtime differs (e.g. after a
+        git checkout or tar extract), a content hash decides instead.
+        Hardlinked source files (same device and inode) are copied once and
+        hardlinked to that copy, including copies made by earlier snapshots.
+
+        When the daemon's change journal covers everything since the last
+        complete backup, only journaled paths are stat'ed; all other files
+        keep their manifest entries without a directory walk.
         """
         start = time.monotonic()
         manifest = manifest or {}
         files_map = manifest.get("files", {})
-        new_files_map: dict[str, float] = {}
+        sizes_map = manifest.get("sizes", {})
+        hashes_map = manifest.get("hashes", {})
+        inodes_map = manifest.get("inodes", {})
+        new_hashes_map: dict[str, str] = {}
+        new_inodes_map: dict[str, list[str]] = {}
         errors: list[str] = []
         copied = 0
         skipped = 0
         bytes_transferred = 0
 
         # Create timestamped snapshot directory
-        ts = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H-%M-%S")
+        ts = datetime.now(timezone.utc).strftime(_TS_FORMAT)
         snapshot_dir = self._target_path / ts
+        summary_path = self._target_path / f"{ts}{_SUMMARY_SUFFIX}"
+
+        # A same-second rerun adds to an existing snapshot, so its summary goes stale
+        reused = snapshot_dir.exists()
 
         try:
+            if reused:
+                summary_path.unlink(missing_ok=True)
             snapshot_dir.mkdir(parents=True, exist_ok=True)
         except OSError as e:
             return BackupResult(
@@ -79,51 +299,174 @@ class LocalBackupProvider:
                 errors=[f"Cannot create snapshot dir: {e}"],
             ), manifest
 
-        # Walk source and copy changed files
-        for root, dirs, files in os.walk(source_dir):
-            # Skip internal directories
-            dirs[:] = [d for d in dirs if d not in _SKIP_DIRS]
-
-            rel_root = Path(root).relative_to(source_dir)
-
-            for fname in files:
-                src_file = Path(root) / fname
-                rel_path = str(rel_root / fname)
-
-                try:
-                    stat = src_file.stat()
-                    mtime = stat.st_mtime
+        # Walk source (or read the change journal) and stat in one batch. The
+        # scan is kept as parallel lists indexed by file; later passes carry
+        # indices, not paths.
+        carried: list[str] = []  # unchanged per the journal, never stat'ed
+        journaled = self._journal_changes(source_dir, manifest)
+        if journaled is None:
+            found = list(_iter_files(str(source_dir), _SKIP_DIRS))
+            rel_paths = [rel_path for rel_path, _entry in found]
+            src_paths = [entry.path for _rel_path, entry in found]
+            stats = _stat_batch([entry for _rel_path, entry in found])
+        else:
+            carried, rel_paths = journaled
+            src_paths = [os.path.join(source_dir, rel_path) for rel_path in rel_paths]
+            stats = _stat_batch(src_paths)
+            # Deleted paths drop out of the manifest; directories are not files
+            present = [
+                i for i, stat in enumerate(stats)
+                if not isinstance(stat, FileNotFoundError)
+                and not (isinstance(stat, os.stat_result) and S_ISDIR(stat.st_mode))
+            ]
+            rel_paths = [rel_paths[i] for i in present]
+            src_paths = [src_paths[i] for i in present]
+            stats = [stats[i] for i in present]
+            skipped += len(carried)
+            log.info("Change journal: %d paths to check, %d carried over",
+                     len(rel_paths), len(carried))
+
+        snapshot_root = str(snapshot_dir)
+        join = os.path.join
+        get_prev_mtime = files_map.get
+        get_prev_size = sizes_map.get
+
+        kept: list[int] = []  # files recorded in the new manifest
+        pending: list[int] = []  # files to copy
+        jobs: list[tuple[str, str]] = []
+        # Hardlinked files: inode key -> snapshot copy made in this run
+        first_copies: dict[str, str] = {}
+        link_jobs: list[tuple[int, str]] = []
+        for i, stat in enumerate(stats):
+            rel_path = rel_paths[i]
+            if isinstance(stat, OSError):
+                errors.append(f"Failed to copy {rel_path}: {stat}")
+                log.warning("Backup copy error: %s — %s", rel_path, stat)
+                continue
 
-                    # Check if file changed since last backup
-                    prev_mtime = files_map.get(rel_path, 0.0)
-                    if mtime <= prev_mtime:
-                        skipped += 1
-                        new_files_map[rel_path] = prev_mtime
+            key = _inode_key(stat) if stat.st_nlink > 1 else ""
+
+            # Check if file changed since last backup
+            prev_mtime = get_prev_mtime(rel_path)
+            prev_size = get_prev_size(rel_path)
+            unchanged = False
+            if prev_mtime is not None:
+                if stat.st_mtime == prev_mtime and prev_size in (None, stat.st_size):
+                    unchanged = True
+                    if rel_path in hashes_map:
+                        new_hashes_map[rel_path] = hashes_map[rel_path]
+                elif prev_size == stat.st_size:
+                    # Same size, different mtime: let the content decide
+                    try:
+                        file_hash = _content_hash(src_paths[i])
+                    except OSError as e:
+                        errors.append(f"Failed to copy {rel_path}: {e}")
+                        log.warning("Backup copy error: %s — %s", rel_path, e)
                         continue
+                    new_hashes_map[rel_path] = file_hash
+                    unchanged = file_hash == hashes_map.get(rel_path)
+            if unchanged:
+                skipped += 1
+                kept.append(i)
+                if key in inodes_map:
+                    new_inodes_map[key] = inodes_map[key]
+                continue
 
-                    # Copy the file
-                    dst_file = snapshot_dir / rel_path
-                    dst_file.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(str(src_file), str(dst_file))
-
-                    new_files_map[rel_path] = mtime
-                    copied += 1
-                    bytes_transferred += stat.st_size
-
-                except OSError as e:
-                    errors.append(f"Failed to copy {rel_path}: {e}")
-                    log.warning("Backup copy error: %s — %s", rel_path, e)
+            dst_file = join(snapshot_root, rel_path)
+            if key and key in first_copies:
+                link_jobs.append((i, first_copies[key]))
+                continue
+            if key and key in inodes_map:
+                prev_copy = self._previous_copy(inodes_map[key], stat)
+                if prev_copy is not None:
+                    link_jobs.append((i, prev_copy))
+                    new_inodes_map[key] = inodes_map[key]
+                    continue
+            if key:
+                first_copies[key] = dst_file
+                new_inodes_map[key] = [ts, rel_path]
+
+            pending.append(i)
+            jobs.append((src_paths[i], dst_file))
+
+        # Copy changed files concurrently
+        snapshot_bytes = 0
+        failed: set[str] = set()
+        created_dirs = {snapshot_root}
+        results = _copy_batch(jobs, created_dirs)
+        for i, (_src, dst_file), err in zip(pending, jobs, results, strict=True):
+            if err is not None:
+                rel_path = rel_paths[i]
+                errors.append(f"Failed to copy {rel_path}: {err}")
+                log.warning("Backup copy error: %s — %s", rel_path, err)
+                failed.add(dst_file)
+                new_inodes_map.pop(_inode_key(stats[i]), None)
+                new_hashes_map.pop(rel_path, None)
+                continue
+            kept.append(i)
+            copied += 1
+            bytes_transferred += stats[i].st_size
+            snapshot_bytes += stats[i].st_size
+
+        # Link the remaining names of hardlinked files to their single copy
+        _make_parent_dirs((join(snapshot_root, rel_paths[i]) for i, _ in link_jobs), created_dirs)
+        for i, existing in link_jobs:
+            rel_path = rel_paths[i]
+            dst_file = join(snapshot_root, rel_path)
+            if existing in failed:
+                err = _copy_file((src_paths[i], dst_file))
+                transferred = stats[i].st_size
+            else:
+                err = _link_or_copy(existing, src_paths[i], dst_file)
+                transferred = 0
+            if err is not None:
+                errors.append(f"Failed to copy {rel_path}: {err}")
+                log.warning("Backup copy error: %s — %s", rel_path, err)
+                new_hashes_map.pop(rel_path, None)
+                continue
+            kept.append(i)
+            copied += 1
+            bytes_transferred += transferred
+            snapshot_bytes += stats[i].st_size
+
+        kept.sort()
+        new_files_map = {rel_path: files_map[rel_path] for rel_path in carried}
+        new_sizes_map = {rel_path: sizes_map[rel_path] for rel_path in carried}
+        new_files_map.update((rel_paths[i], stats[i].st_mtime) for i in kept)
+        new_sizes_map.update((rel_paths[i], stats[i].st_size) for i in kept)
+        if carried:
+            carried_set = set(carried)
+            for rel_path in carried:
+                if rel_path in hashes_map:
+                    new_hashes_map[rel_path] = hashes_map[rel_path]
+            for key, location in inodes_map.items():
+                if key not in new_inodes_map and location[1] in carried_set:
+                    new_inodes_map[key] = location
 
         # If nothing was copied, remove empty snapshot dir
         if copied == 0 and not errors:
             with contextlib.suppress(OSError):
                 shutil.rmtree(str(snapshot_dir))
+        elif not reused and not errors:
+            # Let list_snapshots() read totals instead of walking the snapshot
+            with contextlib.suppress(OSError):
+                summary_path.write_text(
+                    json.dumps({"files": copied, "size_bytes": snapshot_bytes, "created": ts}),
+                    encoding="utf-8",
+                )
 
         duration = time.monotonic() - start
         new_manifest = {
             "provider": "local",
             "last_backup": ts,
             "files": new_files_map,
+            "sizes": new_sizes_map,
+            "hashes": new_hashes_map,
+            "inodes": new_inodes_map,
+            # Only a complete backup can be the baseline for a journal-driven one
+            "complete": not errors,
+            # Snapshot ID of the last backup that walked the whole tree
+            "walked": ts if journaled is None else manifest["walked"],
         }
 
         return BackupResult(
@@ -135,6 +478,59 @@ class LocalBackupProvider:
             errors=errors,
         ), new_manifest
 
+    def _journal_changes(
+        self,
+        source_dir: Path,
+        manifest: dict,
+    ) -> tuple[list[str], list[str]] | None:
+        """Split files into (carried over, to check) using the change journal.
+
+        Journaled directories (created, deleted, moved or modified) expand
+        to every file under them, on disk and in the manifest. Returns None
+        when a full walk is needed: no complete previous backup, none walked
+        the tree in the last _FULL_WALK_SECONDS, or no journal covering
+        everything since the previous backup.
+        """
+        if not manifest.get("complete") or "sizes" not in manifest:
+            return None
+        try:
+            since = _ts_to_unix(manifest["last_backup"])
+            walked = _ts_to_unix(manifest["walked"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        if time.time() - walked >= _FULL_WALK_SECONDS:
+            return None
+        changes = read_changes(source_dir, since)
+        if changes is None:
+            return None
+
+        files_map = manifest.get("files", {})
+        dir_prefixes = tuple(c for c in changes if c.endswith(os.sep))
+        to_check = {c for c in changes if not c.endswith(os.sep)}
+        for prefix in dir_prefixes:
+            rel_dir = prefix.rstrip(os.sep)
+            abs_dir = os.path.join(source_dir, rel_dir)
+            if os.path.isdir(abs_dir):
+                to_check.update(rel for rel, _entry in _iter_files(abs_dir, _SKIP_DIRS, rel_dir))
+        if dir_prefixes:
+            to_check.update(rel for rel in files_map if rel.startswith(dir_prefixes))
+        to_check = {rel for rel in to_check if _SKIP_DIRS.isdisjoint(rel.split(os.sep))}
+
+        carried = [rel for rel in files_map if rel not in to_check]
+        return carried, sorted(to_check)
+
+    def _previous_copy(self, location: list[str], stat: os.stat_result) -> str | None:
+        """Return an earlier snapshot's copy of a hardlinked file if still identical."""
+        snapshot_id, rel_path = location
+        candidate = os.path.join(self._target_path, snapshot_id, rel_path)
+        try:
+            prev = os.stat(candidate)
+        except OSError:
+            return None
+        if prev.st_size != stat.st_size or prev.st_mtime_ns != stat.st_mtime_ns:
+            return None
+        return candidate
+
     def restore(
         self,
         target_dir: Path,
@@ -149,9 +545,9 @@ class LocalBackupProvider:
         if snapshot:
             snapshot_dir = self._target_path / snapshot
         else:
-            # Find latest snapshot
-            snapshots = self.list_snapshots()
-            if not snapshots:
+            # Find latest snapshot — IDs are ISO timestamps, so they sort lexically
+            latest = self._latest_snapshot_id()
+            if latest is None:
                 return BackupResult(
                     success=False,
                     files_copied=0,
@@ -160,7 +556,7 @@ class LocalBackupProvider:
                     duration_seconds=time.monotonic() - start,
                     errors=["No snapshots found"],
                 )
-            snapshot_dir = self._target_path / snapshots[0]["id"]
+            snapshot_dir = self._target_path / latest
 
         if not snapshot_dir.exists():
             return BackupResult(
@@ -174,18 +570,17 @@ class LocalBackupProvider:
 
         # Copy all files from snapshot to target
         target_dir.mkdir(parents=True, exist_ok=True)
-        for root, _dirs, files in os.walk(snapshot_dir):
-            rel_root = Path(root).relative_to(snapshot_dir)
-            for fname in files:
-                src_file = Path(root) / fname
-                dst_file = target_dir / rel_root / fname
-                try:
-                    dst_file.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(str(src_file), str(dst_file))
-                    copied += 1
-                    bytes_transferred += src_file.stat().st_size
-                except OSError as e:
-                    errors.append(f"Failed to restore {fname}: {e}")
+        found = list(_iter_files(str(snapshot_dir)))
+        target_root = str(target_dir)
+        jobs = [(entry.path, os.path.join(target_root, rel_path)) for rel_path, entry in found]
+        results = _copy_batch(jobs, {target_root})
+        for (_rel_path, entry), err in zip(found, results, strict=True):
+            if err is not None:
+                errors.append(f"Failed to restore {entry.name}: {err}")
+                continue
+            copied += 1
+            with contextlib.suppress(OSError):
+                bytes_transferred += entry.stat().st_size
 
         return BackupResult(
             success=len(errors) == 0,
@@ -196,8 +591,20 @@ class LocalBackupProvider:
             errors=errors,
         )
 
+    def _latest_snapshot_id(self) -> str | None:
+        """Name of the newest snapshot dir, without sizing any snapshot."""
+        try:
+            with os.scandir(self._target_path) as it:
+                return max((e.name for e in it if e.is_dir()), default=None)
+        except OSError:
+            return None
+
     def list_snapshots(self) -> list[dict]:
-        """List available backup snapshots, newest first."""
+        """List available backup snapshots, newest first.
+
+        File counts and sizes come from each snapshot's summary sidecar;
+        snapshots without one (older backups, partial runs) are walked.
+        """
         if not self._target_path.exists():
             return []
 
@@ -205,13 +612,11 @@ class LocalBackupProvider:
         for entry in sorted(self._target_path.iterdir(), reverse=True):
             if not entry.is_dir():
                 continue
-            # Count files and total size
-            total_size = 0
-            file_count = 0
-            for root, _dirs, files in os.walk(entry):
-                for f in files:
-                    total_size += (Path(root) / f).stat().st_size
-                    file_count += 1
+            summary = self._read_summary(entry)
+            if summary is None:
+                file_count, total_size = _walk_summary(str(entry))
+            else:
+                file_count, total_size = summary
 
             snapshots.append({
                 "id": entry.name,
@@ -223,6 +628,14 @@ class LocalBackupProvider:
 
         return snapshots
 
+    def _read_summary(self, snapshot_dir: Path) -> tuple[int, int] | None:
+        summary_path = snapshot_dir.with_name(f"{snapshot_dir.name}{_SUMMARY_SUFFIX}")
+        try:
+            data = json.loads(summary_path.read_text(encoding="utf-8"))
+            return int(data["files"]), int(data["size_bytes"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
     def verify(self) -> bool:
         """Verify local backup integrity (directory exists and readable)."""
         return self._target_path.exists() and self._target_path.is_dir()
@@ -0,0 +1,155 @@
+"""Backup manifest persistence — compact columnar file with JSON fallback.
+
+The per-file maps of the local provider's manifest ("files" → mtime and
+"sizes" → byte count) dominate its size. They are stored column-wise: one
+NUL-separated blob of paths plus packed float64 mtimes and int64 sizes.
+Every other key is kept in a small JSON header. Legacy ``.json`` manifests
+are still read and are replaced on the next save.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+
+from anticlaw.core import jsonutil
+
+log = logging.getLogger(__name__)
+
+_MAGIC = b"ACLMAN1\n"
+
+# header length, paths blob length (little-endian)
+_LENGTHS = struct.Struct("<QQ")
+
+# Size column value for files the manifest has no size for
+_NO_SIZE = -1
+
+
+def manifest_path(home: Path, provider_name: str) -> Path:
+    """Return the manifest path for a backup provider."""
+    return home / ".acl" / f"backup_manifest_{provider_name}.bin"
+
+
+def _legacy_path(home: Path, provider_name: str) -> Path:
+    return home / ".acl" / f"backup_manifest_{provider_name}.json"
+
+
+def load_manifest(home: Path, provider_name: str) -> dict | None:
+    """Load a provider's manifest, or None if there is none or it is unreadable."""
+    for path in (manifest_path(home, provider_name), _legacy_path(home, provider_name)):
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            log.warning("Cannot read backup manifest %s: %s", path, e)
+            return None
+        try:
+            return decode_manifest(data)
+        except ValueError as e:
+            log.warning("Corrupt backup manifest %s: %s", path, e)
+            return None
+    return None
+
+
+def save_manifest(home: Path, provider_name: str, manifest: dict) -> None:
+    """Atomically write a provider's manifest and drop any legacy JSON copy."""
+    path = manifest_path(home, provider_name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_bytes(encode_manifest(manifest))
+    os.replace(tmp_path, path)
+    with contextlib.suppress(OSError):
+        _legacy_path(home, provider_name).unlink(missing_ok=True)
+
+
+def encode_manifest(manifest: dict) -> bytes:
+    """Serialize a manifest, storing "files"/"sizes" column-wise when possible."""
+    files = manifest.get("files")
+    sizes = manifest.get("sizes", {})
+    if not _is_columnar(files, sizes):
+        header = json.dumps(manifest, separators=(",", ":")).encode("utf-8")
+        return _MAGIC + _LENGTHS.pack(len(header), 0) + header
+
+    paths = list(files)
+    header = json.dumps(
+        {k: v for k, v in manifest.items() if k not in ("files", "sizes")}
+        | {"columns": len(paths), "has_sizes": "sizes" in manifest},
+        separators=(",", ":"),
+    ).encode("utf-8")
+    blob = "\0".join(paths).encode("utf-8", "surrogatepass")
+    mtimes = array("d", files.values())
+    size_col = array("q", (sizes.get(p, _NO_SIZE) for p in paths))
+    if sys.byteorder == "big":
+        mtimes.byteswap()
+        size_col.byteswap()
+    return b"".join((
+        _MAGIC, _LENGTHS.pack(len(header), len(blob)), header, blob,
+        mtimes.tobytes(), size_col.tobytes(),
+    ))
+
+
+def decode_manifest(data: bytes) -> dict:
+    """Parse a manifest written by encode_manifest(), or a legacy JSON one.
+
+    Raises ValueError if the data is neither.
+    """
+    if not data.startswith(_MAGIC):
+        return _json_object(data)
+
+    pos = len(_MAGIC)
+    try:
+        header_len, blob_len = _LENGTHS.unpack_from(data, pos)
+    except struct.error as e:
+        raise ValueError(f"truncated manifest: {e}") from e
+    pos += _LENGTHS.size
+    manifest = _json_object(data[pos : pos + header_len])
+    pos += header_len
+    count = manifest.pop("columns", None)
+    if count is None:
+        return manifest
+    has_sizes = manifest.pop("has_sizes", True)
+
+    blob = data[pos : pos + blob_len]
+    paths = blob.decode("utf-8", "surrogatepass").split("\0") if count else []
+    pos += blob_len
+    mtimes = array("d")
+    size_col = array("q")
+    mtimes.frombytes(data[pos : pos + 8 * count])
+    size_col.frombytes(data[pos + 8 * count : pos + 16 * count])
+    if len(paths) != count or len(mtimes) != count or len(size_col) != count:
+        raise ValueError("manifest columns have mismatched lengths")
+    if sys.byteorder == "big":
+        mtimes.byteswap()
+        size_col.byteswap()
+
+    manifest["files"] = dict(zip(paths, mtimes.tolist(), strict=True))
+    if has_sizes:
+        manifest["sizes"] = {
+            p: s for p, s in zip(paths, size_col.tolist(), strict=True) if s != _NO_SIZE
+        }
+    return manifest
+
+
+def _json_object(data: bytes) -> dict:
+    obj = jsonutil.loads(data)
+    if not isinstance(obj, dict):
+        raise ValueError("manifest is not a JSON object")
+    return obj
+
+
+def _is_columnar(files: object, sizes: object) -> bool:
+    """Whether the per-file maps fit the packed float64/int64 columns."""
+    if not isinstance(files, dict) or not isinstance(sizes, dict):
+        return False
+    if not sizes.keys() <= files.keys() or any("\0" in p for p in files):
+        return False
+    return all(
+        type(m) in (int, float) for m in files.values()
+    ) and all(type(s) is int and s >= 0 for s in sizes.values())
@@ -2,12 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
+from collections import OrderedDict
+from typing import TYPE_CHECKING
 
 from anticlaw.providers.embedding.base import EmbeddingInfo
 
+if TYPE_CHECKING:
+    import httpx
+    import numpy as np
+
 log = logging.getLogger(__name__)
 
+# Concurrent /api/embed requests used by aembed_batch()
+_CONCURRENCY = 4
+
+# Default number of embeddings kept in the in-memory LRU cache
+_CACHE_SIZE = 4096
+
 
 class OllamaEmbeddingProvider:
     """Generate embeddings via Ollama HTTP API.
@@ -16,6 +30,16 @@ class OllamaEmbeddingProvider:
     both single and batch embedding.
 
     Default model: nomic-embed-text (768-dim, ~275 MB).
+
+    A single HTTP client is kept for the provider's lifetime so repeated
+    calls reuse the keep-alive connection; call close() (or use the
+    provider as a context manager) to release it.
+
+    Embeddings are memoized in an LRU cache keyed by a hash of the text
+    (config 'cache_size', 0 disables), so re-indexing unchanged or
+    repeated chunks does not hit the model again. Cached vectors are
+    stored as tuples and every call returns fresh lists, so callers may
+    modify the result in place.
     """
 
     def __init__(self, config: dict | None = None) -> None:
@@ -23,6 +47,35 @@ class OllamaEmbeddingProvider:
         self._model = config.get("model", "nomic-embed-text")
         self._base_url = config.get("base_url", "http://localhost:11434").rstrip("/")
         self._dimensions = config.get("dimensions", 768)
+        self._timeout = float(config.get("timeout", 60.0))
+        self._batch_timeout = float(config.get("batch_timeout", 120.0))
+        self._client: httpx.Client | None = None
+        self._cache_size = int(config.get("cache_size", _CACHE_SIZE))
+        self._cache: OrderedDict[bytes, tuple[float, ...]] = OrderedDict()
+
+    def _get_client(self) -> httpx.Client:
+        """Return the shared HTTP client, creating it on first use."""
+        if self._client is None:
+            import httpx
+
+            self._client = httpx.Client(
+                base_url=self._base_url,
+                timeout=self._timeout,
+                limits=httpx.Limits(max_keepalive_connections=4),
+            )
+        return self._client
+
+    def close(self) -> None:
+        """Close the shared HTTP client, if one was opened."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def __enter__(self) -> OllamaEmbeddingProvider:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
 
     @property
     def name(self) -> str:
@@ -39,31 +92,158 @@ class OllamaEmbeddingProvider:
             requires_auth=False,
         )
 
+    # --- Embedding cache ---
+
+    @staticmethod
+    def _cache_key(text: str) -> bytes:
+        return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+    def _cache_get(self, key: bytes) -> tuple[float, ...] | None:
+        vector = self._cache.get(key)
+        if vector is not None:
+            self._cache.move_to_end(key)
+        return vector
+
+    def _cache_put(self, key: bytes, vector: tuple[float, ...]) -> None:
+        if self._cache_size <= 0:
+            return
+        self._cache[key] = vector
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    def _partition(
+        self, texts: list[str],
+    ) -> tuple[list[bytes], dict[bytes, tuple[float, ...]], dict[bytes, str]]:
+        """Split *texts* into cached vectors and unique misses, both keyed by hash."""
+        keys = [self._cache_key(t) for t in texts]
+        found: dict[bytes, tuple[float, ...]] = {}
+        misses: dict[bytes, str] = {}
+        for key, text in zip(keys, texts, strict=True):
+            if key in found or key in misses:
+                continue
+            vector = self._cache_get(key)
+            if vector is None:
+                misses[key] = text
+            else:
+                found[key] = vector
+        return keys, found, misses
+
+    def _merge(
+        self,
+        keys: list[bytes],
+        found: dict[bytes, tuple[float, ...]],
+        misses: dict[bytes, str],
+        vectors: list[list[float]],
+    ) -> list[list[float]]:
+        """Cache freshly embedded *vectors* and return all vectors in input order.
+
+        Each result is a new list, so repeated texts do not share one vector.
+        """
+        for key, vector in zip(misses, vectors, strict=True):
+            found[key] = tuple(vector)
+            self._cache_put(key, found[key])
+        return [list(found[key]) for key in keys]
+
+    # --- Embedding ---
+
     def embed(self, text: str) -> list[float]:
         """Embed a single text via Ollama /api/embed."""
-        import httpx
+        key = self._cache_key(text)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return list(cached)
 
-        resp = httpx.post(
-            f"{self._base_url}/api/embed",
+        resp = self._get_client().post(
+            "/api/embed",
             json={"model": self._model, "input": text},
-            timeout=60.0,
         )
         resp.raise_for_status()
         data = resp.json()
-        return data["embeddings"][0]
+        vector = data["embeddings"][0]
+        self._cache_put(key, tuple(vector))
+        return vector
 
     def embed_batch(self, texts: list[str]) -> list[list[float]]:
-        """Embed multiple texts in a single request."""
+        """Embed multiple texts in a single request (cached texts are not sent)."""
+        if not texts:
+            return []
+
+        keys, found, misses = self._partition(texts)
+        vectors: list[list[float]] = []
+        if misses:
+            resp = self._get_client().post(
+                "/api/embed",
+                json={"model": self._model, "input": list(misses.values())},
+                timeout=self._batch_timeout,
+            )
+            resp.raise_for_status()
+            vectors = resp.json()["embeddings"]
+        return self._merge(keys, found, misses, vectors)
+
+    def embed_batch_array(self, texts: list[str]) -> np.ndarray:
+        """Embed texts into a float32 array of shape (len(texts), dimensions).
+
+        Packs the vectors into one contiguous buffer — about 14x smaller
+        than nested Python floats and ready for vectorized similarity math.
+        Requires numpy (installed with the ``semantic`` extra).
+        """
+        import numpy as np
+
+        if not texts:
+            return np.empty((0, self._dimensions), dtype=np.float32)
+        return np.asarray(self.embed_batch(texts), dtype=np.float32)
+
+    async def aembed_batch(
+        self,
+        texts: list[str],
+        concurrency: int = _CONCURRENCY,
+    ) -> list[list[float]]:
+        """Embed texts as several concurrent /api/embed requests.
+
+        The input is split into *concurrency* contiguous slices that are
+        sent in parallel, so the Ollama server can overlap them instead of
+        working through one large request. Cached texts are not sent.
+        Order of the result matches *texts*.
+        """
         import httpx
 
         if not texts:
             return []
 
-        resp = httpx.post(
-            f"{self._base_url}/api/embed",
-            json={"model": self._model, "input": texts},
-            timeout=120.0,
-        )
-        resp.raise_for_status()
-        data = resp.json()
-        return data["embeddings"]
+        keys, found, misses = self._partition(texts)
+        if not misses:
+            return self._merge(keys, found, misses, [])
+
+        pending = list(misses.values())
+        concurrency = max(1, min(concurrency, len(pending)))
+        size = -(-len(pending) // concurrency)
+        slices = [pending[i : i + size] for i in range(0, len(pending), size)]
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async with httpx.AsyncClient(
+            base_url=self._base_url,
+            timeout=self._batch_timeout,
+        ) as client:
+
+            async def embed_slice(chunk: list[str]) -> list[list[float]]:
+                async with semaphore:
+                    resp = await client.post(
+                        "/api/embed",
+                        json={"model": self._model, "input": chunk},
+                    )
+                resp.raise_for_status()
+                return resp.json()["embeddings"]
+
+            results = await asyncio.gather(*(embed_slice(c) for c in slices))
+
+        vectors = [vector for chunk in results for vector in chunk]
+        return self._merge(keys, found, misses, vectors)
+
+    def embed_batch_parallel(
+        self,
+        texts: list[str],
+        concurrency: int = _CONCURRENCY,
+    ) -> list[list[float]]:
+        """Synchronous wrapper around aembed_batch()."""
+        return asyncio.run(self.aembed_batch(texts, concurrency))
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import zipfile
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from pathlib import Path
 
+from anticlaw.core import jsonutil
 from anticlaw.core.models import ChatData, ChatMessage, RemoteChat, RemoteProject, SyncResult
+from anticlaw.providers.llm import parallel
 from anticlaw.providers.llm.base import Capability, ProviderInfo
-from anticlaw.providers.llm.claude import scrub_text
+from anticlaw.providers.llm.claude import scrub_texts
 
 log = logging.getLogger(__name__)
 
@@ -72,37 +74,53 @@ class ChatGPTProvider:
         Returns:
             List of ChatData ready for local storage.
         """
-        raw_json = _extract_conversations_json(zip_path)
-        conversations = json.loads(raw_json)
-
-        if not isinstance(conversations, list):
-            raise ValueError("Expected a JSON array of conversations")
-
-        chats: list[ChatData] = []
-        for conv in conversations:
-            try:
-                chat_data = _parse_conversation(conv, scrub=scrub)
-                chats.append(chat_data)
-            except Exception:
-                conv_id = conv.get("conversation_id", conv.get("id", "unknown"))
-                log.warning("Failed to parse conversation %s", conv_id, exc_info=True)
+        chats = parallel.parse_batches(
+            _parse_conversation_batch, _iter_conversations(zip_path), scrub
+        )
 
         log.info("Parsed %d conversations from %s", len(chats), zip_path.name)
         return chats
 
 
-def _extract_conversations_json(zip_path: Path) -> str:
-    """Extract conversations.json from a ChatGPT export ZIP."""
+def _parse_conversation_batch(convs: list[dict], scrub: bool = False) -> list[ChatData]:
+    """Parse a batch of conversations, skipping (and logging) malformed ones."""
+    chats: list[ChatData] = []
+    for conv in convs:
+        try:
+            chats.append(_parse_conversation(conv, scrub=scrub))
+        except Exception:
+            conv_id = conv.get("conversation_id", conv.get("id", "unknown"))
+            log.warning("Failed to parse conversation %s", conv_id, exc_info=True)
+    return chats
+
+
+def _iter_conversations(zip_path: Path) -> Iterator[dict]:
+    """Yield conversation dicts from conversations.json in a ChatGPT export ZIP.
+
+    With ijson installed the ZIP member is parsed as a stream, so only one
+    conversation is held in memory at a time; otherwise the raw bytes are
+    parsed in one go (orjson when available, no intermediate decode).
+    """
     with zipfile.ZipFile(zip_path, "r") as zf:
-        # Try common locations
-        for candidate in ["conversations.json", "chatgpt/conversations.json"]:
-            if candidate in zf.namelist():
-                return zf.read(candidate).decode("utf-8")
+        name = _find_conversations_json(zf, zip_path)
+        with zf.open(name) as stream:
+            yield from jsonutil.iter_array(stream)
+
+
+def _find_conversations_json(zf: zipfile.ZipFile, zip_path: Path) -> str:
+    """Return the member name of conversations.json in a ChatGPT export ZIP."""
+    names = zf.namelist()
+    name_set = set(names)
+
+    # Try common locations
+    for candidate in ("conversations.json", "chatgpt/conversations.json"):
+        if candidate in name_set:
+            return candidate
 
-        # Fallback: find any conversations.json
-        for name in zf.namelist():
-            if name.endswith("conversations.json"):
-                return zf.read(name).decode("utf-8")
+    # Fallback: find any conversations.json (archive order)
+    for name in names:
+        if name.endswith("conversations.json"):
+            return name
 
     raise FileNotFoundError(
         f"No conversations.json found in {zip_path.name}. "
@@ -136,7 +154,9 @@ def _parse_conversation(conv: dict, scrub: bool = False) -> ChatData:
     # Walk the mapping tree to get ordered messages
     ordered_nodes = _walk_message_tree(mapping)
 
-    messages: list[ChatMessage] = []
+    roles: list[str] = []
+    contents: list[str] = []
+    timestamps: list[datetime] = []
     model = ""
 
     for node in ordered_nodes:
@@ -153,18 +173,23 @@ def _parse_conversation(conv: dict, scrub: bool = False) -> ChatData:
         if not content:
             continue
 
-        if scrub:
-            content = scrub_text(content)
-
-        timestamp = _parse_unix_timestamp(msg.get("create_time"))
-
-        messages.append(ChatMessage(role=role, content=content, timestamp=timestamp))
+        roles.append(role)
+        contents.append(content)
+        timestamps.append(_parse_unix_timestamp(msg.get("create_time")))
 
         # Extract model from metadata (use the last assistant message's model)
         if role == "assistant" and not model:
             metadata = msg.get("metadata", {})
             model = metadata.get("model_slug", "")
 
+    if scrub:
+        contents = scrub_texts(contents)
+
+    messages = [
+        ChatMessage(role=role, content=content, timestamp=timestamp)
+        for role, content, timestamp in zip(roles, contents, timestamps, strict=True)
+    ]
+
     return ChatData(
         remote_id=conv_id,
         title=title,
@@ -180,36 +205,36 @@ def _walk_message_tree(mapping: dict) -> list[dict]:
     """Walk the ChatGPT mapping tree to produce messages in conversation order.
 
     ChatGPT stores messages as a tree (for branching). We follow the
-    primary path: root → first child → first child → ... to get the
+    primary path: root → last child → last child → ... to get the
     linear conversation.
     """
-    # Find root node (no parent or parent not in mapping)
+    # One pass: find the root (no parent or parent not in mapping) and
+    # index the active (last) child of every node
     root_id = None
+    last_child_of: dict[str, str] = {}
     for node_id, node in mapping.items():
-        parent = node.get("parent")
-        if parent is None or parent not in mapping:
-            root_id = node_id
-            break
+        if root_id is None:
+            parent = node.get("parent")
+            if parent is None or parent not in mapping:
+                root_id = node_id
+        children = node.get("children")
+        if children:
+            last_child_of[node_id] = children[-1]
 
     if root_id is None:
         return []
 
-    # Walk from root following children
+    # Walk from root following the active branch
     ordered: list[dict] = []
-    current_id = root_id
+    current_id: str | None = root_id
     visited: set[str] = set()
-
-    while current_id and current_id not in visited:
+    while current_id is not None and current_id not in visited:
         visited.add(current_id)
         node = mapping.get(current_id)
         if node is None:
             break
-
         ordered.append(node)
-
-        # Follow the last child (ChatGPT uses last child as the active branch)
-        children = node.get("children", [])
-        current_id = children[-1] if children else None
+        current_id = last_child_of.get(current_id)
 
     return ordered
 
@@ -239,6 +264,13 @@ def _extract_content(msg: dict) -> str:
 
     content_type = content.get("content_type", "")
 
+    # Fast path: plain text messages whose parts are all strings
+    if content_type == "text":
+        parts = content.get("parts") or ()
+        if all(type(part) is str for part in parts):
+            text = "\n".join(parts)
+            return text.strip() if text[:1].isspace() or text[-1:].isspace() else text
+
     # Text and multimodal_text use "parts" array
     if content_type in ("text", "multimodal_text"):
         parts = content.get("parts", [])
@@ -2,18 +2,49 @@
 
 from __future__ import annotations
 
-import json
+import functools
 import logging
+import os
 import zipfile
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import IO
 
+from anticlaw.core import jsonutil
 from anticlaw.core.models import ChatData, ChatMessage, RemoteChat, RemoteProject, SyncResult
+from anticlaw.providers.llm import parallel
 from anticlaw.providers.llm.base import Capability, ProviderInfo
-from anticlaw.providers.llm.claude import scrub_text
+from anticlaw.providers.llm.claude import scrub_texts
 
 log = logging.getLogger(__name__)
 
+# Conversation files at least this big are streamed with ijson, keeping only
+# the fields _parse_conversation reads (inline attachments can be huge)
+_STREAM_MIN_BYTES = 4 * 1024 * 1024
+
+_CONV_KEYS = frozenset({
+    "id", "conversation_id", "title", "name",
+    "create_time", "created", "createTime", "update_time", "updated", "updateTime",
+    "model", "model_name", "modelName",
+    "messages", "turns", "chunks", "chunkedPrompt",
+})
+_MSG_KEYS = frozenset({
+    "role", "text", "content", "parts",
+    "create_time", "timestamp", "createTime", "model", "model_name",
+})
+_PART_KEYS = frozenset({"text"})
+
+# Case-folded endings of a conversation file's path inside a Takeout ZIP
+_CONV_SUFFIXES = frozenset({"/conversation.json", "\\conversation.json"})
+_CONV_SUFFIX_LEN = len("/conversation.json")
+
+# ijson prefix of an object → keys kept from it (objects not listed keep all)
+_KEEP_KEYS: dict[str, frozenset[str]] = {"": _CONV_KEYS, "chunkedPrompt": frozenset({"chunks"})}
+for _array in ("messages", "turns", "chunks", "chunkedPrompt.chunks"):
+    _KEEP_KEYS[f"{_array}.item"] = _MSG_KEYS
+    _KEEP_KEYS[f"{_array}.item.content.item"] = _PART_KEYS
+    _KEEP_KEYS[f"{_array}.item.parts.item"] = _PART_KEYS
+
 
 class GeminiProvider:
     """Gemini LLM provider — parses Google Takeout Gemini exports."""
@@ -84,26 +115,22 @@ class GeminiProvider:
 
     def _parse_zip(self, zip_path: Path, scrub: bool = False) -> list[ChatData]:
         """Parse conversations from a Takeout ZIP file."""
-        conv_files = _find_conversation_files(zip_path)
-        if not conv_files:
-            raise FileNotFoundError(
-                f"No Gemini conversation files found in {zip_path.name}. "
-                f"Expected a Google Takeout ZIP with Gemini data."
-            )
-
-        chats: list[ChatData] = []
         with zipfile.ZipFile(zip_path, "r") as zf:
-            for conv_path in conv_files:
-                try:
-                    raw = zf.read(conv_path).decode("utf-8")
-                    conv = json.loads(raw)
-                    # Derive folder name for title fallback
-                    folder_name = _folder_name_from_path(conv_path)
-                    chat_data = _parse_conversation(conv, folder_name=folder_name, scrub=scrub)
-                    chats.append(chat_data)
-                except Exception:
-                    log.warning("Failed to parse %s", conv_path, exc_info=True)
-
+            conv_files = _find_conversation_files(zf)
+            if not conv_files:
+                raise FileNotFoundError(
+                    f"No Gemini conversation files found in {zip_path.name}. "
+                    f"Expected a Google Takeout ZIP with Gemini data."
+                )
+
+            if len(conv_files) < parallel.PARALLEL_MIN:
+                # Small export: read from the handle already open
+                chats = _parse_zip_members(zf, conv_files, scrub)
+            else:
+                # Workers get member names and open the ZIP themselves
+                chats = parallel.parse_batches(
+                    _parse_zip_entries, conv_files, zip_path, scrub
+                )
         log.info("Parsed %d conversations from %s", len(chats), zip_path.name)
         return chats
 
@@ -117,7 +144,7 @@ class GeminiProvider:
                 f"Expected Google Takeout structure with Gemini/Conversations/."
             )
 
-        chats: list[ChatData] = []
+        conv_files: list[tuple[Path, str]] = []
         for item in sorted(conv_dir.iterdir()):
             conv_file = None
             folder_name = ""
@@ -130,46 +157,107 @@ class GeminiProvider:
                 conv_file = item
                 folder_name = item.stem
 
-            if conv_file is None:
-                continue
-
-            try:
-                raw = conv_file.read_text(encoding="utf-8")
-                conv = json.loads(raw)
-                chat_data = _parse_conversation(conv, folder_name=folder_name, scrub=scrub)
-                chats.append(chat_data)
-            except Exception:
-                log.warning("Failed to parse %s", conv_file, exc_info=True)
+            if conv_file is not None:
+                conv_files.append((conv_file, folder_name))
 
+        chats = parallel.parse_batches(_parse_files, conv_files, scrub)
         log.info("Parsed %d conversations from %s", len(chats), dir_path)
         return chats
 
 
-def _find_conversation_files(zip_path: Path) -> list[str]:
-    """Find all conversation.json files inside a Takeout ZIP."""
+def _parse_zip_entries(conv_paths: list[str], zip_path: Path, scrub: bool) -> list[ChatData]:
+    """Parse conversation files from a Takeout ZIP (worker entry point)."""
     with zipfile.ZipFile(zip_path, "r") as zf:
-        names = zf.namelist()
-
-    results: list[str] = []
-    for name in names:
-        # Match patterns like:
-        # Takeout/Gemini Apps/Conversations/*/conversation.json
-        # Takeout/Gemini/Conversations/*/conversation.json
-        # Gemini/Conversations/*/conversation.json
-        # */conversation.json (fallback)
-        lower = name.lower()
-        is_conv = lower.endswith("/conversation.json") or lower.endswith("\\conversation.json")
-        if is_conv and "gemini" in lower:
-            results.append(name)
-
-    # If no gemini-specific paths, try any conversation.json in subfolders
-    if not results:
-        for name in names:
-            lower = name.lower()
-            if lower.endswith("/conversation.json") or lower.endswith("\\conversation.json"):
-                results.append(name)
-
-    return sorted(results)
+        return _parse_zip_members(zf, conv_paths, scrub)
+
+
+def _parse_zip_members(
+    zf: zipfile.ZipFile, conv_paths: list[str], scrub: bool
+) -> list[ChatData]:
+    """Parse conversation files from an open Takeout ZIP, skipping malformed ones."""
+    chats: list[ChatData] = []
+    for conv_path in conv_paths:
+        try:
+            info = zf.getinfo(conv_path)
+            with zf.open(info) as stream:
+                conv = _load_conversation(stream, info.file_size)
+            # Derive folder name for title fallback
+            folder_name = _folder_name_from_path(conv_path)
+            chats.append(_parse_conversation(conv, folder_name=folder_name, scrub=scrub))
+        except Exception:
+            log.warning("Failed to parse %s", conv_path, exc_info=True)
+    return chats
+
+
+def _parse_files(files: list[tuple[Path, str]], scrub: bool) -> list[ChatData]:
+    """Parse (conversation file, folder name) pairs, skipping malformed ones."""
+    chats: list[ChatData] = []
+    for conv_file, folder_name in files:
+        try:
+            with conv_file.open("rb") as stream:
+                conv = _load_conversation(stream, conv_file.stat().st_size)
+            chats.append(_parse_conversation(conv, folder_name=folder_name, scrub=scrub))
+        except Exception:
+            log.warning("Failed to parse %s", conv_file, exc_info=True)
+    return chats
+
+
+def _load_conversation(stream: IO[bytes], size: int) -> dict:
+    """Load a conversation JSON file; large ones are streamed and pruned."""
+    if size < _STREAM_MIN_BYTES or not jsonutil.HAS_IJSON:
+        return jsonutil.loads(stream.read())
+    return _stream_conversation(stream)
+
+
+def _stream_conversation(stream: IO[bytes]) -> dict:
+    """Build a conversation from ijson events, skipping unread subtrees.
+
+    Keys not in _KEEP_KEYS for their object are dropped together with their
+    value, so unused payloads (inline images, safety ratings, ...) are never
+    materialized.
+    """
+    import ijson
+
+    builder = ijson.ObjectBuilder()
+    skip_depth = 0
+    skipping = False
+    for prefix, event, value in ijson.parse(stream, use_float=True):
+        if skipping:
+            if event in ("start_map", "start_array"):
+                skip_depth += 1
+            elif event in ("end_map", "end_array"):
+                skip_depth -= 1
+            skipping = skip_depth > 0
+            continue
+        if event == "map_key":
+            keep = _KEEP_KEYS.get(prefix)
+            if keep is not None and value not in keep:
+                skipping = True
+                continue
+        builder.event(event, value)
+    return builder.value
+
+
+def _find_conversation_files(zf: zipfile.ZipFile) -> list[str]:
+    """Find all conversation.json files inside an open Takeout ZIP."""
+    # Match patterns like:
+    # Takeout/Gemini Apps/Conversations/*/conversation.json
+    # Takeout/Gemini/Conversations/*/conversation.json
+    # Gemini/Conversations/*/conversation.json
+    # */conversation.json (fallback)
+    gemini: list[str] = []
+    other: list[str] = []
+    for name in zf.namelist():
+        # Lowercase only the tail: most entries are not conversation files
+        if name[-_CONV_SUFFIX_LEN:].lower() not in _CONV_SUFFIXES:
+            continue
+        if "gemini" in name.lower():
+            gemini.append(name)
+        else:
+            other.append(name)
+
+    # If no gemini-specific paths, take any conversation.json in subfolders
+    return sorted(gemini or other)
 
 
 def _find_conversations_dir(dir_path: Path) -> Path | None:
@@ -186,15 +274,18 @@ def _find_conversations_dir(dir_path: Path) -> Path | None:
         if candidate.is_dir():
             return candidate
 
-    # Fallback: walk one level for any "Conversations" dir
-    for item in dir_path.iterdir():
-        if item.is_dir() and item.name.lower() == "conversations":
-            return item
+    # Fallback: walk one level for any "Conversations" dir. scandir entries
+    # carry their file type, so is_dir() usually needs no extra stat.
+    with os.scandir(dir_path) as entries:
+        subdirs = [entry for entry in entries if entry.is_dir()]
+    for item in subdirs:
+        if item.name.lower() == "conversations":
+            return Path(item.path)
         # Check one more level
-        if item.is_dir():
-            for sub in item.iterdir():
-                if sub.is_dir() and sub.name.lower() == "conversations":
-                    return sub
+        with os.scandir(item.path) as sub_entries:
+            for sub in sub_entries:
+                if sub.name.lower() == "conversations" and sub.is_dir():
+                    return Path(sub.path)
 
     return None
 
@@ -234,13 +325,14 @@ def _parse_conversation(
     if not title:
         title = _title_from_folder_name(folder_name) if folder_name else "Untitled"
 
-    # Timestamps
+    # Timestamps: missing ones fall back to now, read once per conversation
+    now = datetime.now(timezone.utc)
     created = _parse_timestamp(
-        conv.get("create_time") or conv.get("created") or conv.get("createTime")
+        conv.get("create_time") or conv.get("created") or conv.get("createTime"), now
     )
     updated = _parse_timestamp(
-        conv.get("update_time") or conv.get("updated") or conv.get("updateTime")
-    ) or created
+        conv.get("update_time") or conv.get("updated") or conv.get("updateTime"), created
+    )
 
     # Model info
     model = (
@@ -263,7 +355,9 @@ def _parse_conversation(
         if isinstance(chunked, dict):
             raw_messages = chunked.get("chunks", [])
 
-    messages: list[ChatMessage] = []
+    roles: list[str] = []
+    contents: list[str] = []
+    timestamps: list[datetime] = []
     for msg in raw_messages:
         role = _normalize_role(msg.get("role", ""))
         if not role:
@@ -273,19 +367,24 @@ def _parse_conversation(
         if not content:
             continue
 
-        if scrub:
-            content = scrub_text(content)
-
-        timestamp = _parse_timestamp(
-            msg.get("create_time") or msg.get("timestamp") or msg.get("createTime")
-        )
-
-        messages.append(ChatMessage(role=role, content=content, timestamp=timestamp))
+        roles.append(role)
+        contents.append(content)
+        timestamps.append(_parse_timestamp(
+            msg.get("create_time") or msg.get("timestamp") or msg.get("createTime"), now
+        ))
 
         # Extract model from message metadata if not set at conversation level
         if not model and role == "assistant":
             model = msg.get("model", "") or msg.get("model_name", "")
 
+    if scrub:
+        contents = scrub_texts(contents)
+
+    messages = [
+        ChatMessage(role=role, content=content, timestamp=timestamp)
+        for role, content, timestamp in zip(roles, contents, timestamps, strict=True)
+    ]
+
     return ChatData(
         remote_id=conv_id,
         title=title,
@@ -297,15 +396,24 @@ def _parse_conversation(
     )
 
 
+# Gemini's role names → our standard roles; exact-case keys hit first.
+# system/tool/thought messages are not listed and get skipped.
+_ROLE_MAP = {
+    "user": "human",
+    "human": "human",
+    "model": "assistant",
+    "assistant": "assistant",
+    "User": "human",
+    "Model": "assistant",
+}
+
+
 def _normalize_role(role: str) -> str:
     """Map Gemini's role names to our standard roles."""
-    role = role.lower().strip()
-    if role in ("user", "human"):
-        return "human"
-    if role in ("model", "assistant"):
-        return "assistant"
-    # Skip system/tool/thought messages
-    return ""
+    normalized = _ROLE_MAP.get(role)
+    if normalized is not None:
+        return normalized
+    return _ROLE_MAP.get(role.lower().strip(), "")
 
 
 def _extract_content(msg: dict) -> str:
@@ -316,49 +424,42 @@ def _extract_content(msg: dict) -> str:
     - "content": "..." (string)
     - "content": [{"text": "..."}] (structured parts)
     - "parts": [{"text": "..."}] (API-style)
+
+    The first shape that yields non-blank text wins; messages in one
+    conversation do not always share a shape.
     """
     # Direct text field
     text = msg.get("text")
-    if isinstance(text, str) and text.strip():
-        return text.strip()
+    if isinstance(text, str) and (text := text.strip()):
+        return text
 
-    # Content as string
+    # Content as string or list of parts
     content = msg.get("content")
-    if isinstance(content, str) and content.strip():
-        return content.strip()
-
-    # Content as list of parts
-    if isinstance(content, list):
-        parts = []
-        for part in content:
-            if isinstance(part, str):
-                parts.append(part)
-            elif isinstance(part, dict):
-                t = part.get("text", "")
-                if t:
-                    parts.append(t)
-        result = "\n".join(parts).strip()
-        if result:
-            return result
+    if isinstance(content, str):
+        if content := content.strip():
+            return content
+    elif isinstance(content, list) and (text := _join_parts(content)):
+        return text
 
     # Parts field (Gemini API style)
-    parts_field = msg.get("parts")
-    if isinstance(parts_field, list):
-        parts = []
-        for part in parts_field:
-            if isinstance(part, str):
-                parts.append(part)
-            elif isinstance(part, dict):
-                t = part.get("text", "")
-                if t:
-                    parts.append(t)
-        result = "\n".join(parts).strip()
-        if result:
-            return result
+    parts = msg.get("parts")
+    if isinstance(parts, list):
+        return _join_parts(parts)
 
     return ""
 
 
+def _join_parts(parts: list) -> str:
+    """Join string parts and the "text" of dict parts, stripped."""
+    texts: list[str] = []
+    for part in parts:
+        if isinstance(part, str):
+            texts.append(part)
+        elif isinstance(part, dict) and (t := part.get("text", "")):
+            texts.append(t)
+    return "\n".join(texts).strip()
+
+
 def _title_from_folder_name(folder_name: str) -> str:
     """Derive a human-readable title from a Takeout folder name.
 
@@ -381,38 +482,48 @@ def _title_from_folder_name(folder_name: str) -> str:
     return name.title()
 
 
-def _parse_timestamp(value: str | float | int | None) -> datetime:
-    """Parse a timestamp from Gemini's export (ISO 8601 or Unix epoch)."""
-    if value is None:
-        return datetime.now(timezone.utc)
-
-    # Unix timestamp (numeric)
-    if isinstance(value, (int, float)):
-        try:
-            return datetime.fromtimestamp(float(value), tz=timezone.utc)
-        except (ValueError, TypeError, OSError):
-            return datetime.now(timezone.utc)
+def _parse_timestamp(
+    value: str | float | int | None, default: datetime | None = None
+) -> datetime:
+    """Parse a timestamp from Gemini's export (ISO 8601 or Unix epoch).
 
-    # String timestamp — try ISO 8601 first
+    Missing or malformed values yield ``default``, or the current time if
+    none is given.
+    """
+    dt = None
     if isinstance(value, str):
-        value_str = value.strip()
-        if not value_str:
-            return datetime.now(timezone.utc)
+        dt = _parse_timestamp_str(value)
+    elif isinstance(value, (int, float)):
+        dt = _from_epoch(value)
+    if dt is not None:
+        return dt
+    return default if default is not None else datetime.now(timezone.utc)
 
-        # Try ISO 8601
-        try:
-            cleaned = value_str.replace("Z", "+00:00")
-            dt = datetime.fromisoformat(cleaned)
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt
-        except (ValueError, TypeError):
-            pass
 
+@functools.lru_cache(maxsize=8192)
+def _parse_timestamp_str(value: str) -> datetime | None:
+    """Parse an ISO 8601 or numeric timestamp string, or None if malformed.
+
+    Cached: messages in a conversation often share a timestamp string.
+    """
+    value_str = value.strip()
+    if not value_str:
+        return None
+
+    # Try ISO 8601
+    try:
+        dt = datetime.fromisoformat(value_str.replace("Z", "+00:00"))
+    except ValueError:
         # Try parsing as numeric string
         try:
-            return datetime.fromtimestamp(float(value_str), tz=timezone.utc)
-        except (ValueError, TypeError, OSError):
-            pass
+            return _from_epoch(float(value_str))
+        except ValueError:
+            return None
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=timezone.utc)
+
 
-    return datetime.now(timezone.utc)
+def _from_epoch(value: float) -> datetime | None:
+    try:
+        return datetime.fromtimestamp(float(value), tz=timezone.utc)
+    except (ValueError, OverflowError, OSError):
+        return None
@@ -0,0 +1,54 @@
+"""Process-pool batch parsing shared by the export parsers."""
+
+from __future__ import annotations
+
+import itertools
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from anticlaw.core.models import ChatData
+
+# Exports with fewer items are parsed in-process — pool startup would dominate
+PARALLEL_MIN = 100
+
+# Items per worker task
+PARSE_BATCH = 50
+
+
+def parse_batches(
+    parse_batch: Callable[..., list[ChatData]],
+    items: Iterable,
+    *args: object,
+) -> list[ChatData]:
+    """Run ``parse_batch(batch, *args)`` over ``items``, preserving order.
+
+    Fewer than PARALLEL_MIN items are parsed in one in-process call. Larger
+    inputs go to a process pool in batches of PARSE_BATCH; at most two
+    batches per worker are in flight, so a streamed export is never fully
+    materialized in the parent process. ``parse_batch`` must be a
+    module-level function so workers can unpickle it.
+    """
+    it = iter(items)
+    head = list(itertools.islice(it, PARALLEL_MIN))
+    if len(head) < PARALLEL_MIN:
+        return parse_batch(head, *args)
+
+    workers = os.cpu_count() or 1
+    chats: list[ChatData] = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        inflight: deque[Future[list[ChatData]]] = deque()
+        for batch in _batched(itertools.chain(head, it), PARSE_BATCH):
+            inflight.append(pool.submit(parse_batch, batch, *args))
+            if len(inflight) >= workers * 2:
+                chats.extend(inflight.popleft().result())
+        while inflight:
+            chats.extend(inflight.popleft().result())
+    return chats
+
+
+def _batched(items: Iterable, size: int) -> Iterator[list]:
+    it = iter(items)
+    while batch := list(itertools.islice(it, size)):
+        yield batch
@@ -8,7 +8,7 @@ from dataclasses import dataclass, field
 log = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProviderEntry:
     """Metadata about a registered provider."""
 
@@ -39,12 +39,7 @@ class ProviderRegistry:
 
     def get(self, family: str, name: str, config: dict | None = None) -> object:
         """Instantiate a provider by family and name."""
-        fam = self._providers.get(family)
-        if fam is None:
-            raise KeyError(f"Unknown provider family: {family!r}")
-        entry = fam.get(name)
-        if entry is None:
-            raise KeyError(f"Unknown provider: {family}/{name!r}")
+        entry = self.get_entry(family, name)
         if config is not None:
             return entry.cls(config)
         return entry.cls()
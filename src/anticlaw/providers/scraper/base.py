@@ -7,7 +7,7 @@ from pathlib import Path
 from typing import Protocol, runtime_checkable
 
 
-@dataclass
+@dataclass(slots=True)
 class ScraperInfo:
     """Display metadata for a scraper provider."""
 
@@ -16,7 +16,7 @@ class ScraperInfo:
     capabilities: set[str] = field(default_factory=set)  # {"projects", "chat_mapping"}
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapedMapping:
     """Result of a scrape operation: chat→project mapping + project metadata."""
 
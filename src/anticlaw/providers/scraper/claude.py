@@ -5,16 +5,21 @@ from intercepted API responses, then uses page.evaluate() with
 offset-based pagination to fetch ALL chats (starred + unstarred).
 Each chat object contains a project field with uuid and name, so a
 single session captures the full chat→project mapping.
+
+The org_id is cached in .acl/claude_meta.json for a day; a tab already
+on claude.ai then fetches without loading the app again.
 """
 
 from __future__ import annotations
 
-import json
+import itertools
 import logging
 import re
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 
+from anticlaw.core import jsonutil
 from anticlaw.core.fileutil import safe_filename
 
 from .base import ScrapedMapping, ScraperInfo
@@ -25,28 +30,61 @@ BASE_URL = "https://claude.ai"
 
 _RE_ORG_ID = re.compile(r"/api/organizations/([a-f0-9-]{36})/")
 
+# How long to wait for the org ID after navigating, and how often to check
+_ORG_ID_TIMEOUT_MS = 30_000
+_ORG_ID_POLL_MS = 100
+
+# How long a cached org ID is trusted before discovering it again
+_ORG_ID_TTL_S = 24 * 3600
+
+# Pages of chat_conversations requested at once per starred flag
+_PAGE_WINDOW = 4
+
 # JavaScript for offset-based pagination of chat_conversations.
-# Accepts [orgId, starred] array. Returns all chats across pages.
+# Accepts [orgId, starredFlags, window] array. Paginates each starred flag
+# concurrently, requesting `window` pages at a time and reading them in
+# order up to the first short page; the browser multiplexes the requests.
+# Returns one list of chats per flag, cut down to the fields the mapping
+# uses, so full chat objects are never serialized over CDP and rebuilt in
+# Python.
 _JS_FETCH_CHATS = """
 async (args) => {
-    const [orgId, starred] = args;
-    const chats = [];
-    let offset = 0;
+    const [orgId, starredFlags, window] = args;
     const limit = 50;
-    while (true) {
-        const url = `/api/organizations/${orgId}`
-            + `/chat_conversations`
-            + `?limit=${limit}&offset=${offset}`
-            + `&starred=${starred}`
-            + `&consistency=eventual`;
-        const r = await fetch(url);
+    const base = `/api/organizations/${orgId}`
+        + `/chat_conversations`
+        + `?limit=${limit}&consistency=eventual`;
+    const fetchPage = async (starred, offset) => {
+        const r = await fetch(
+            `${base}&starred=${starred}&offset=${offset}`,
+        );
         const data = await r.json();
-        if (!Array.isArray(data) || data.length === 0) break;
-        chats.push(...data);
-        if (data.length < limit) break;
-        offset += limit;
-    }
-    return chats;
+        return Array.isArray(data) ? data : [];
+    };
+    const fetchChats = async (starred) => {
+        const chats = [];
+        for (let offset = 0; ; offset += limit * window) {
+            const pages = await Promise.all(
+                Array.from(
+                    {length: window},
+                    (_, i) => fetchPage(starred, offset + i * limit),
+                ),
+            );
+            for (const data of pages) {
+                for (const c of data) {
+                    const p = c.project;
+                    chats.push({
+                        uuid: c.uuid,
+                        project: p && typeof p === "object"
+                            ? {uuid: p.uuid, name: p.name}
+                            : null,
+                    });
+                }
+                if (data.length < limit) return chats;
+            }
+        }
+    };
+    return Promise.all(starredFlags.map(fetchChats));
 }
 """
 
@@ -55,12 +93,17 @@ class ClaudeScraper:
     """Scrape chat→project mapping from Claude.ai via CDP."""
 
     def __init__(
-        self, cdp_url: str = "http://localhost:9222"
+        self,
+        cdp_url: str = "http://localhost:9222",
+        home: Path | None = None,
     ) -> None:
         self._cdp_url = cdp_url
+        self._meta_path = home / ".acl" / "claude_meta.json" if home else None
         self._org_id: str | None = None
-        self._chats: dict[str, dict] = {}
-        self._projects: dict[str, dict] = {}
+        # chat uuid -> project uuid ("" when the chat has no project)
+        self._chats: dict[str, str] = {}
+        # project uuid -> project name
+        self._projects: dict[str, str] = {}
 
     @property
     def name(self) -> str:
@@ -76,51 +119,121 @@ class ClaudeScraper:
 
     def _handle_response(self, response: object) -> None:
         """Intercept org_id from any API response."""
+        if self._org_id:
+            return
         url = response.url  # type: ignore[attr-defined]
+        # Most responses are assets and telemetry; skip the regex for them
+        if "/api/organizations/" not in url:
+            return
+        m = _RE_ORG_ID.search(url)
+        if m:
+            self._org_id = m.group(1)
+            log.info("Discovered org_id: %s", self._org_id)
+
+    def _load_org_id(self) -> str | None:
+        """Return the org ID cached by a previous scrape, if still fresh."""
+        if self._meta_path is None:
+            return None
+        try:
+            meta = jsonutil.loads(self._meta_path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            log.warning("Cannot read %s: %s", self._meta_path, e)
+            return None
+        if not isinstance(meta, dict):
+            return None
+        org_id = meta.get("org_id")
+        saved_at = meta.get("saved_at")
+        if not isinstance(org_id, str) or not isinstance(saved_at, (int, float)):
+            return None
+        if time.time() - saved_at > _ORG_ID_TTL_S:
+            return None
+        return org_id
+
+    def _save_org_id(self) -> None:
+        """Cache the org ID so the next scrape can skip discovery."""
+        if self._meta_path is None or not self._org_id:
+            return
+        try:
+            self._meta_path.parent.mkdir(parents=True, exist_ok=True)
+            self._meta_path.write_bytes(
+                jsonutil.dumps({"org_id": self._org_id, "saved_at": time.time()})
+            )
+        except OSError as e:
+            log.warning("Cannot write %s: %s", self._meta_path, e)
+
+    def _open_claude(self, page: object) -> None:
+        """Navigate to claude.ai and discover the org ID from its API calls."""
+        page.on("response", self._handle_response)  # type: ignore[attr-defined]
+
+        page.goto(BASE_URL, wait_until="commit")  # type: ignore[attr-defined]
+        self._wait_for_org_id(page)
+        # Pagination triggers hundreds of responses; don't dispatch
+        # each one to Python once the org ID is known
+        page.remove_listener("response", self._handle_response)  # type: ignore[attr-defined]
+        page.wait_for_load_state("domcontentloaded")  # type: ignore[attr-defined]
 
         if not self._org_id:
-            m = _RE_ORG_ID.search(url)
-            if m:
-                self._org_id = m.group(1)
-                log.info("Discovered org_id: %s", self._org_id)
+            raise RuntimeError(
+                "Could not discover org ID. "
+                "Is Chrome logged in to claude.ai?"
+            )
+
+    def _wait_for_org_id(self, page: object) -> None:
+        """Let Playwright dispatch responses until the org ID is known.
+
+        Returns as soon as _handle_response has seen an org API URL, instead
+        of waiting for network idle, which claude.ai's background requests
+        can hold off for many seconds. Gives up after _ORG_ID_TIMEOUT_MS.
+        """
+        for _ in range(_ORG_ID_TIMEOUT_MS // _ORG_ID_POLL_MS):
+            if self._org_id:
+                return
+            page.wait_for_timeout(_ORG_ID_POLL_MS)  # type: ignore[attr-defined]
 
     def _process_chats(self, chats: list[dict]) -> int:
-        """Store chat objects and extract project info.
+        """Record each chat's project uuid and extract project info.
 
         Returns count of chats added.
         """
+        chat_projects = self._chats
+        projects = self._projects
         count = 0
         for chat in chats:
             chat_uuid = chat.get("uuid", "")
             if not chat_uuid:
                 continue
-            self._chats[chat_uuid] = chat
             count += 1
 
             project = chat.get("project")
-            if not isinstance(project, dict):
-                continue
-            proj_uuid = project.get("uuid", "")
-            if proj_uuid and proj_uuid not in self._projects:
-                self._projects[proj_uuid] = {
-                    "name": project.get("name", "Untitled"),
-                }
+            if isinstance(project, dict):
+                proj_uuid = project.get("uuid", "")
+                if proj_uuid and proj_uuid not in projects:
+                    # The fetch script sends a null name when the API omits it
+                    projects[proj_uuid] = project.get("name") or "Untitled"
+            else:
+                proj_uuid = ""
+            chat_projects[chat_uuid] = proj_uuid
 
         log.info(
             "Processed %d chats (total %d)",
             count,
-            len(self._chats),
+            len(chat_projects),
         )
         return count
 
     def _fetch_all_chats(self, page: object) -> None:
-        """Fetch all chats via paginated evaluate calls."""
-        for starred in (True, False):
+        """Fetch starred and unstarred chats in one paginated evaluate call."""
+        flags = (True, False)
+        log.info("Fetching starred and unstarred chats...")
+        results = page.evaluate(  # type: ignore[attr-defined]
+            _JS_FETCH_CHATS, [self._org_id, list(flags), _PAGE_WINDOW]
+        )
+        if not isinstance(results, list):
+            results = []
+        for starred, result in itertools.zip_longest(flags, results[: len(flags)]):
             label = "starred" if starred else "unstarred"
-            log.info("Fetching %s chats...", label)
-            result = page.evaluate(  # type: ignore[attr-defined]
-                _JS_FETCH_CHATS, [self._org_id, starred]
-            )
             if not isinstance(result, list):
                 result = []
             added = self._process_chats(result)
@@ -133,22 +246,21 @@ class ClaudeScraper:
 
     def _build_mapping(self) -> ScrapedMapping:
         """Build mapping from captured chats."""
-        chat_mapping: dict[str, str] = {}
-
-        for chat_uuid, chat in self._chats.items():
-            project = chat.get("project")
-            if not isinstance(project, dict):
-                continue
-            proj_uuid = project.get("uuid", "")
-            if not proj_uuid:
-                continue
-            proj_name = project.get("name", "Untitled")
-            chat_mapping[chat_uuid] = safe_filename(proj_name)
+        # Many chats share a project: slugify each project name once
+        folders = {
+            proj_uuid: safe_filename(name)
+            for proj_uuid, name in self._projects.items()
+        }
+        chat_mapping = {
+            chat_uuid: folders[proj_uuid]
+            for chat_uuid, proj_uuid in self._chats.items()
+            if proj_uuid
+        }
 
         project_metadata: dict[str, dict] = {}
-        for proj_uuid, info in self._projects.items():
+        for proj_uuid, name in self._projects.items():
             project_metadata[proj_uuid] = {
-                "name": info["name"],
+                "name": name,
                 "instructions": "",
             }
 
@@ -199,19 +311,30 @@ class ClaudeScraper:
                     pages[0] if pages else context.new_page()
                 )
 
-            page.on("response", self._handle_response)
+            # A tab already on claude.ai can fetch with a cached org ID
+            # without loading the app again
+            cached = None if self._org_id else self._load_org_id()
+            if cached and (
+                page.url == BASE_URL or page.url.startswith(BASE_URL + "/")
+            ):
+                self._org_id = cached
+                try:
+                    self._fetch_all_chats(page)
+                except Exception as e:
+                    # Expired session: the API answers with HTML or a redirect
+                    log.info("Fetch with cached org ID failed, rediscovering: %s", e)
+                    self._org_id = None
+                    self._chats.clear()
+                    self._projects.clear()
+                if self._org_id and not self._chats:
+                    # Logged in to another account since it was cached
+                    log.info("Cached org ID returned no chats, rediscovering")
+                    self._org_id = None
 
-            page.goto("https://claude.ai")
-            page.wait_for_load_state("networkidle")
-
-            if not self._org_id:
-                raise RuntimeError(
-                    "Could not discover org ID. "
-                    "Is Chrome logged in to claude.ai?"
-                )
-
-            # Fetch ALL chats with offset-based pagination
-            self._fetch_all_chats(page)
+            if not self._chats:
+                self._open_claude(page)
+                # Fetch ALL chats with offset-based pagination
+                self._fetch_all_chats(page)
 
             if not self._chats:
                 raise RuntimeError(
@@ -231,17 +354,15 @@ class ClaudeScraper:
             )
 
             output.parent.mkdir(parents=True, exist_ok=True)
-            output.write_text(
-                json.dumps(
+            output.write_bytes(
+                jsonutil.dumps(
                     {
                         "chats": mapping.chats,
                         "projects": mapping.projects,
                         "scraped_at": mapping.scraped_at,
                     },
-                    indent=2,
-                    ensure_ascii=False,
-                ),
-                encoding="utf-8",
+                    indent=True,
+                )
             )
 
             log.info(
@@ -249,6 +370,7 @@ class ClaudeScraper:
                 len(mapping.chats),
                 len(mapping.projects),
             )
+            self._save_org_id()
             return mapping
 
         finally:
@@ -47,6 +47,7 @@ class TestBackupInfo:
         assert info.display_name == "Local copy"
         assert info.supports_incremental is True
         assert info.requires_auth is False
+        assert info.supports_hardlinks is False
 
 
 class TestBackupProtocol:
@@ -63,3 +63,20 @@ class TestGDriveBackupNoService:
     def test_list_snapshots_empty_without_service(self):
         p = GDriveBackupProvider({"folder_id": "fake"})
         assert p.list_snapshots() == []
+
+
+class TestGDriveServiceReuse:
+    def test_service_cached_across_calls(self):
+        p = GDriveBackupProvider({"folder_id": "root-id"})
+        service = MagicMock()
+        p._service = service
+        assert p.verify() is True
+        assert p.auth({}) is True
+        assert p._get_service() is service
+
+    def test_execute_uses_retries(self):
+        p = GDriveBackupProvider({"folder_id": "root-id"})
+        service = MagicMock()
+        p._service = service
+        p.verify()
+        service.files().get().execute.assert_called_with(num_retries=3)
@@ -1,9 +1,21 @@
 """Tests for anticlaw.providers.backup.local — LocalBackupProvider."""
 
+import errno
 import os
+import sys
 from pathlib import Path
+from unittest.mock import patch
 
-from anticlaw.providers.backup.local import LocalBackupProvider
+import pytest
+
+from anticlaw.daemon.journal import ChangeJournal
+from anticlaw.providers.backup import local
+from anticlaw.providers.backup.local import (
+    LocalBackupProvider,
+    _fast_copy,
+    _iter_files,
+    _stat_batch,
+)
 
 
 class TestLocalBackupProviderMeta:
@@ -31,6 +43,69 @@ class TestLocalBackupProviderMeta:
         assert p.verify() is True
 
 
+class TestIterFiles:
+    def test_yields_relative_paths_and_skips_dirs(self, tmp_path: Path):
+        (tmp_path / "a" / "b").mkdir(parents=True)
+        (tmp_path / ".git").mkdir()
+        (tmp_path / "top.md").write_text("x", encoding="utf-8")
+        (tmp_path / "a" / "b" / "deep.md").write_text("y", encoding="utf-8")
+        (tmp_path / ".git" / "HEAD").write_text("ref", encoding="utf-8")
+
+        found = {rel: entry.stat().st_size for rel, entry in _iter_files(str(tmp_path), {".git"})}
+        assert found == {"top.md": 1, os.path.join("a", "b", "deep.md"): 1}
+
+    def test_missing_root_yields_nothing(self, tmp_path: Path):
+        assert list(_iter_files(str(tmp_path / "missing"))) == []
+
+
+class TestStatBatch:
+    def test_serial_and_threaded_agree(self, tmp_path: Path, monkeypatch):
+        for i in range(5):
+            (tmp_path / f"f{i}.md").write_text("x" * i, encoding="utf-8")
+        entries = [entry for _rel, entry in _iter_files(str(tmp_path))]
+        serial = [s.st_size for s in _stat_batch(entries)]
+
+        monkeypatch.setattr(local, "_STAT_BATCH_MIN", 1)
+        entries = [entry for _rel, entry in _iter_files(str(tmp_path))]
+        threaded = [s.st_size for s in _stat_batch(entries)]
+        assert serial == threaded
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="DirEntry.stat() is cached on Windows")
+    def test_returns_error_for_vanished_file(self, tmp_path: Path):
+        f = tmp_path / "gone.md"
+        f.write_text("x", encoding="utf-8")
+        entries = [entry for _rel, entry in _iter_files(str(tmp_path))]
+        f.unlink()
+        assert isinstance(_stat_batch(entries)[0], OSError)
+
+
+class TestFastCopy:
+    def _make_src(self, tmp_path: Path) -> Path:
+        src = tmp_path / "src.md"
+        src.write_bytes(b"payload" * 1000)
+        os.utime(src, (1_600_000_000, 1_600_000_000))
+        return src
+
+    def test_copies_data_and_mtime(self, tmp_path: Path):
+        src = self._make_src(tmp_path)
+        dst = tmp_path / "dst.md"
+        _fast_copy(str(src), str(dst))
+        assert dst.read_bytes() == src.read_bytes()
+        assert dst.stat().st_mtime == src.stat().st_mtime
+
+    def test_falls_back_when_copy_range_unsupported(self, tmp_path: Path, monkeypatch):
+        def unsupported(*args):
+            raise OSError(errno.EXDEV, "cross-device")
+
+        monkeypatch.setattr(local, "_HAS_COPY_FILE_RANGE", True)
+        monkeypatch.setattr(os, "copy_file_range", unsupported, raising=False)
+        src = self._make_src(tmp_path)
+        dst = tmp_path / "dst.md"
+        _fast_copy(str(src), str(dst))
+        assert dst.read_bytes() == src.read_bytes()
+        assert dst.stat().st_mtime == src.stat().st_mtime
+
+
 class TestLocalBackup:
     def _create_source(self, tmp_path: Path) -> Path:
         """Create a source directory with some .md files."""
@@ -141,6 +216,234 @@ class TestLocalBackup:
         assert result2.files_copied == 0
         assert result2.files_skipped == 3
 
+    def test_older_mtime_with_new_content_is_copied(self, tmp_path: Path):
+        src = tmp_path / "source"
+        src.mkdir()
+        f = src / "chat.md"
+        f.write_text("version A", encoding="utf-8")
+        os.utime(f, (2_000_000_000, 2_000_000_000))
+
+        target = tmp_path / "backups"
+        target.mkdir()
+        p = LocalBackupProvider({"path": str(target)})
+        _, manifest = p.backup(src, None)
+
+        # Same size, different content, mtime moved backwards (git checkout / tar)
+        f.write_text("version B", encoding="utf-8")
+        os.utime(f, (1_000_000_000, 1_000_000_000))
+        result, manifest = p.backup(src, manifest)
+        assert result.files_copied == 1
+        assert "chat.md" in manifest["hashes"]
+
+        # Only the mtime changes now: the stored hash proves the content is the same
+        os.utime(f, (1_500_000_000, 1_500_000_000))
+        result, manifest = p.backup(src, manifest)
+        assert result.files_copied == 0
+        assert result.files_skipped == 1
+        assert manifest["files"]["chat.md"] == 1_500_000_000
+
+    def test_legacy_manifest_without_sizes(self, tmp_path: Path):
+        src = tmp_path / "source"
+        src.mkdir()
+        (src / "chat.md").write_text("content", encoding="utf-8")
+
+        target = tmp_path / "backups"
+        target.mkdir()
+        p = LocalBackupProvider({"path": str(target)})
+        _, manifest = p.backup(src, None)
+
+        legacy = {"provider": "local", "files": manifest["files"]}
+        result, _ = p.backup(src, legacy)
+        assert result.files_skipped == 1
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="DirEntry.stat() has no inode on Windows")
+    def test_hardlinks_copied_once(self, tmp_path: Path):
+        src = tmp_path / "source"
+        src.mkdir()
+        (src / "a.md").write_text("shared", encoding="utf-8")
+        os.link(src / "a.md", src / "b.md")
+
+        target = tmp_path / "backups"
+        target.mkdir()
+        p = LocalBackupProvider({"path": str(target)})
+        result, manifest = p.backup(src, None)
+
+        assert result.files_copied == 2
+        assert result.bytes_transferred == len("shared")
+        snap = target / manifest["last_backup"]
+        assert (snap / "a.md").stat().st_ino == (snap / "b.md").stat().st_ino
+        assert len(manifest["inodes"]) == 1
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="DirEntry.stat() has no inode on Windows")
+    def test_new_hardlink_links_to_previous_snapshot(self, tmp_path: Path):
+        src = tmp_path / "source"
+        src.mkdir()
+        (src / "a.md").write_text("shared", encoding="utf-8")
+        os.link(src / "a.md", src / "b.md")
+
+        target = tmp_path / "backups"
+        target.mkdir()
+        p = LocalBackupProvider({"path": str(target)})
+        _, manifest = p.backup(src, None)
+
+        # Move the first snapshot out of the way so the next one gets its own dir
+        old_snap = target / "2000-01-01T00-00-00"
+        (target / manifest["last_backup"]).rename(old_snap)
+        manifest["inodes"] = {k: [old_snap.name, v[1]] for k, v in manifest["inodes"].items()}
+
+        # A new name for the same inode appears; its data must not be copied again
+        os.link(src / "a.md", src / "c.md")
+        result, manifest2 = p.backup(src, manifest)
+
+        assert result.files_copied == 1
+        assert result.files_skipped == 2
+        assert result.bytes_transferred == 0
+        new_copy = target / manifest2["last_backup"] / "c.md"
+        assert new_copy.stat().st_ino == (old_snap / "a.md").stat().st_ino
+
+    def test_concurrent_copy_round_trip(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr(local, "_COPY_BATCH_MIN", 1)
+        src = tmp_path / "source"
+        for i in range(20):
+            d = src / f"project-{i % 4}"
+            d.mkdir(parents=True, exist_ok=True)
+            (d / f"chat{i}.md").write_text(f"chat {i}", encoding="utf-8")
+
+        target = tmp_path / "backups"
+        target.mkdir()
+        p = LocalBackupProvider({"path": str(target)})
+        result, manifest = p.backup(src, None)
+        assert result.success is True
+        assert result.files_copied == 20
+        assert len(manifest["files"]) == 20
+
+        restore_dir = tmp_path / "restored"
+        restored = p.restore(restore_dir, None)
+        assert restored.files_copied == 20
+        assert (restore_dir / "project-3" / "chat7.md").read_text(encoding="utf-8") == "chat 7"
+
+    def test_parent_dirs_created_once(self, tmp_path: Path, monkeypatch):
+        src = tmp_path / "source"
+        for i in range(12):
+            d = src / f"project-{i % 3}" / "nested"
+            d.mkdir(parents=True, exist_ok=True)
+            (d / f"chat{i}.md").write_text(f"chat {i}", encoding="utf-8")
+        target = tmp_path / "backups"
+        target.mkdir()
+
+        calls: list[str] = []
+        real_makedirs = os.makedirs
+
+        def counting_makedirs(path, *args, **kwargs):
+            calls.append(str(path))
+            return real_makedirs(path, *args, **kwargs)
+
+        monkeypatch.setattr(local.os, "makedirs", counting_makedirs)
+        p = LocalBackupProvider({"path": str(target)})
+        result, _manifest = p.backup(src, None)
+        assert result.files_copied == 12
+        # makedirs recurses for missing ancestors; count only the leaf requests
+        assert len([c for c in calls if c.endswith("nested")]) == 3
+
+        calls.clear()
+        restored = p.restore(tmp_path / "restored", None)
+        assert restored.files_copied == 12
+        assert len([c for c in calls if c.endswith("nested")]) == 3
+
+
+class TestJournalBackup:
+    def _setup(self, tmp_path: Path):
+        src = tmp_path / "source"
+        (src / "proj").mkdir(parents=True)
+        (src / "a.md").write_text("a", encoding="utf-8")
+        (src / "c.md").write_text("c", encoding="utf-8")
+        (src / "proj" / "b.md").write_text("b", encoding="utf-8")
+        # Started long before the first backup, as a running daemon would be
+        journal = ChangeJournal(src)
+        with patch("anticlaw.daemon.journal.time.time", return_value=0.0):
+            journal.start()
+        target = tmp_path / "backups"
+        target.mkdir()
+        return src, journal, LocalBackupProvider({"path": str(target)})
+
+    def test_only_journaled_paths_checked(self, tmp_path: Path):
+        src, journal, p = self._setup(tmp_path)
+        result, manifest = p.backup(src, None)
+        assert result.files_copied == 3
+        assert manifest["complete"] is True
+
+        (src / "a.md").write_text("a changed", encoding="utf-8")
+        (src / "c.md").unlink()
+        (src / "proj" / "new.md").write_text("new", encoding="utf-8")
+        (src / "unjournaled.md").write_text("x", encoding="utf-8")
+        for name in ("a.md", "c.md", "proj/new.md"):
+            journal.record(str(src / name))
+
+        result, manifest = p.backup(src, manifest)
+        assert result.success
+        assert result.files_copied == 2
+        assert result.files_skipped == 1
+        assert set(manifest["files"]) == {
+            "a.md", os.path.join("proj", "b.md"), os.path.join("proj", "new.md"),
+        }
+        assert manifest["sizes"]["a.md"] == len("a changed")
+        journal.close()
+
+    def test_directory_move_expands(self, tmp_path: Path):
+        src, journal, p = self._setup(tmp_path)
+        _result, manifest = p.backup(src, None)
+
+        (src / "proj").rename(src / "moved")
+        journal.record(str(src / "proj"), is_directory=True)
+        journal.record(str(src / "moved"), is_directory=True)
+
+        result, manifest = p.backup(src, manifest)
+        assert result.files_copied == 1
+        assert set(manifest["files"]) == {"a.md", "c.md", os.path.join("moved", "b.md")}
+        journal.close()
+
+    def test_walks_without_journal_or_complete_manifest(self, tmp_path: Path):
+        src, journal, p = self._setup(tmp_path)
+        _result, manifest = p.backup(src, None)
+        (src / "unjournaled.md").write_text("x", encoding="utf-8")
+
+        incomplete = {**manifest, "complete": False}
+        _result, walked = p.backup(src, incomplete)
+        assert "unjournaled.md" in walked["files"]
+
+        journal.close()
+        _result, walked = p.backup(src, manifest)
+        assert "unjournaled.md" in walked["files"]
+
+    def test_directory_modified_rechecks_directory(self, tmp_path: Path):
+        src, journal, p = self._setup(tmp_path)
+        _result, manifest = p.backup(src, None)
+
+        (src / "proj" / "lost.md").write_text("lost", encoding="utf-8")
+        journal.record(str(src / "proj"), is_directory=True)
+
+        result, manifest = p.backup(src, manifest)
+        assert result.files_copied == 1
+        assert os.path.join("proj", "lost.md") in manifest["files"]
+        journal.close()
+
+    def test_periodic_full_walk(self, tmp_path: Path):
+        src, journal, p = self._setup(tmp_path)
+        _result, manifest = p.backup(src, None)
+        assert manifest["walked"] == manifest["last_backup"]
+        (src / "unjournaled.md").write_text("x", encoding="utf-8")
+
+        _result, journaled = p.backup(src, manifest)
+        assert "unjournaled.md" not in journaled["files"]
+        assert journaled["walked"] == manifest["walked"]
+
+        for stale in ({**journaled, "walked": "2000-01-01T00-00-00"},
+                      {k: v for k, v in journaled.items() if k != "walked"}):
+            _result, walked = p.backup(src, stale)
+            assert "unjournaled.md" in walked["files"]
+            assert walked["walked"] == walked["last_backup"]
+        journal.close()
+
 
 class TestLocalRestore:
     def test_restore_latest(self, tmp_path: Path):
@@ -212,6 +515,50 @@ class TestLocalListSnapshots:
         assert snapshots[0]["provider"] == "local"
         assert snapshots[0]["files"] == 1
 
+    def test_list_uses_summary_sidecar(self, tmp_path: Path):
+        src = tmp_path / "source"
+        src.mkdir()
+        (src / "a.md").write_text("12345", encoding="utf-8")
+        (src / "b.md").write_text("678", encoding="utf-8")
+
+        target = tmp_path / "backups"
+        target.mkdir()
+        p = LocalBackupProvider({"path": str(target)})
+        _, manifest = p.backup(src, None)
+
+        sidecar = target / f"{manifest['last_backup']}.summary.json"
+        assert sidecar.exists()
+        snap = p.list_snapshots()[0]
+        assert (snap["files"], snap["size_bytes"]) == (2, 8)
+
+        # Restore must not bring the sidecar back
+        restore_dir = tmp_path / "restored"
+        p.restore(restore_dir, None)
+        assert sorted(f.name for f in restore_dir.iterdir()) == ["a.md", "b.md"]
+
+    def test_list_walks_snapshot_without_summary(self, tmp_path: Path):
+        target = tmp_path / "backups"
+        snap = target / "2025-01-01T00-00-00"
+        snap.mkdir(parents=True)
+        (snap / "chat.md").write_text("abc", encoding="utf-8")
+
+        p = LocalBackupProvider({"path": str(target)})
+        snapshots = p.list_snapshots()
+        assert snapshots[0]["files"] == 1
+        assert snapshots[0]["size_bytes"] == 3
+
+    def test_list_sees_nested_changes_without_summary(self, tmp_path: Path):
+        target = tmp_path / "backups"
+        nested = target / "2025-01-01T00-00-00" / "project"
+        nested.mkdir(parents=True)
+        (nested / "chat.md").write_text("abc", encoding="utf-8")
+
+        p = LocalBackupProvider({"path": str(target)})
+        assert p.list_snapshots()[0]["files"] == 1
+        (nested / "other.md").write_text("de", encoding="utf-8")
+        snap = p.list_snapshots()[0]
+        assert (snap["files"], snap["size_bytes"]) == (2, 5)
+
     def test_list_empty(self, tmp_path: Path):
         target = tmp_path / "backups"
         p = LocalBackupProvider({"path": str(target)})
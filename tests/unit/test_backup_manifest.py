@@ -0,0 +1,98 @@
+"""Tests for anticlaw.providers.backup.manifest — compact manifest persistence."""
+
+import json
+from pathlib import Path
+
+from anticlaw.providers.backup.local import LocalBackupProvider
+from anticlaw.providers.backup.manifest import (
+    decode_manifest,
+    encode_manifest,
+    load_manifest,
+    manifest_path,
+    save_manifest,
+)
+
+LOCAL_MANIFEST = {
+    "provider": "local",
+    "last_backup": "2025-02-20T03-00-00",
+    "files": {"a.md": 1700000000.123456, "proj/b.md": 1700000001.5, "ünï\udcff.md": 3.0},
+    "sizes": {"a.md": 10, "proj/b.md": 0, "ünï\udcff.md": 7},
+    "hashes": {"a.md": "abcd"},
+    "inodes": {"1:2": ["2025-02-20T03-00-00", "a.md"]},
+    "complete": True,
+}
+
+
+class TestEncodeDecode:
+    def test_round_trip_columnar(self):
+        data = encode_manifest(LOCAL_MANIFEST)
+        assert decode_manifest(data) == LOCAL_MANIFEST
+        # Paths are stored once, not repeated as JSON keys per map
+        assert data.count(b"proj/b.md") == 1
+
+    def test_round_trip_partial_sizes(self):
+        manifest = {"files": {"a.md": 1.0, "b.md": 2.0}, "sizes": {"a.md": 5}}
+        assert decode_manifest(encode_manifest(manifest)) == manifest
+
+    def test_round_trip_without_sizes(self):
+        manifest = {"files": {"a.md": 1.0}}
+        assert decode_manifest(encode_manifest(manifest)) == manifest
+
+    def test_round_trip_empty(self):
+        manifest = {"provider": "local", "files": {}, "sizes": {}}
+        assert decode_manifest(encode_manifest(manifest)) == manifest
+
+    def test_non_columnar_manifest_kept_as_json(self):
+        manifest = {
+            "provider": "gdrive",
+            "folder_id": "xyz",
+            "hashes": {"a.md": "123"},
+            "file_ids": {"a.md": "id1"},
+        }
+        assert decode_manifest(encode_manifest(manifest)) == manifest
+
+    def test_legacy_json(self):
+        data = json.dumps(LOCAL_MANIFEST).encode("utf-8")
+        assert decode_manifest(data) == json.loads(data)
+
+
+class TestLoadSave:
+    def test_save_and_load(self, tmp_path: Path):
+        save_manifest(tmp_path, "local", LOCAL_MANIFEST)
+        assert manifest_path(tmp_path, "local").exists()
+        assert load_manifest(tmp_path, "local") == LOCAL_MANIFEST
+
+    def test_missing(self, tmp_path: Path):
+        assert load_manifest(tmp_path, "local") is None
+
+    def test_legacy_json_read_then_replaced(self, tmp_path: Path):
+        legacy = tmp_path / ".acl" / "backup_manifest_local.json"
+        legacy.parent.mkdir()
+        legacy.write_text(json.dumps({"last_backup": "x", "files": {}}), encoding="utf-8")
+
+        manifest = load_manifest(tmp_path, "local")
+        assert manifest == {"last_backup": "x", "files": {}}
+
+        save_manifest(tmp_path, "local", manifest)
+        assert not legacy.exists()
+        assert load_manifest(tmp_path, "local") == manifest
+
+    def test_corrupt_returns_none(self, tmp_path: Path):
+        path = manifest_path(tmp_path, "local")
+        path.parent.mkdir()
+        path.write_bytes(b"ACLMAN1\n\x01")
+        assert load_manifest(tmp_path, "local") is None
+
+    def test_incremental_backup_through_saved_manifest(self, tmp_path: Path):
+        src = tmp_path / "source"
+        src.mkdir()
+        (src / "a.md").write_text("a", encoding="utf-8")
+        target = tmp_path / "backups"
+        target.mkdir()
+        p = LocalBackupProvider({"path": str(target)})
+
+        _result, manifest = p.backup(src, None)
+        save_manifest(tmp_path, "local", manifest)
+        result, _manifest = p.backup(src, load_manifest(tmp_path, "local"))
+        assert result.files_copied == 0
+        assert result.files_skipped == 1
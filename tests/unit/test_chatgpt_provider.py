@@ -7,6 +7,8 @@ from pathlib import Path
 
 import pytest
 
+from anticlaw.core import jsonutil
+from anticlaw.providers.llm import chatgpt, parallel
 from anticlaw.providers.llm.base import Capability
 from anticlaw.providers.llm.chatgpt import ChatGPTProvider
 
@@ -529,6 +531,15 @@ class TestParseExportZip:
         chats = provider.parse_export_zip(zip_path)
         assert len(chats) == 2
 
+    def test_known_location_preferred_over_fallback(self, tmp_path: Path):
+        zip_path = tmp_path / "both.zip"
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr("old/conversations.json", json.dumps([]))
+            zf.writestr("chatgpt/conversations.json", json.dumps(SAMPLE_CONVERSATIONS))
+
+        with zipfile.ZipFile(zip_path) as zf:
+            assert chatgpt._find_conversations_json(zf, zip_path) == "chatgpt/conversations.json"
+
     def test_malformed_conversation_skipped(self, tmp_path: Path):
         """A malformed conversation should be skipped, not crash the whole import."""
         conversations = [
@@ -638,3 +649,89 @@ class TestModelExtraction:
         chats = provider.parse_export_zip(zip_path)
 
         assert chats[0].model == "gpt-3.5-turbo"
+
+
+class TestStreamingParse:
+    @pytest.fixture(params=[True, False], ids=["ijson", "stdlib"])
+    def streaming(self, request, monkeypatch):
+        if request.param and not jsonutil.HAS_IJSON:
+            pytest.skip("ijson not installed")
+        monkeypatch.setattr(jsonutil, "HAS_IJSON", request.param)
+        return request.param
+
+    def test_same_result_with_and_without_ijson(self, tmp_path: Path, streaming):
+        zip_path = _make_export_zip(tmp_path, SAMPLE_CONVERSATIONS)
+        chats = ChatGPTProvider().parse_export_zip(zip_path)
+
+        assert [c.remote_id for c in chats] == ["conv-chatgpt-001", "conv-chatgpt-002"]
+        assert chats[0].created == datetime(2025, 2, 18, 14, 30, tzinfo=timezone.utc)
+
+    def test_non_array_rejected(self, tmp_path: Path, streaming):
+        zip_path = tmp_path / "bad.zip"
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr("conversations.json", json.dumps({"not": "a list"}))
+
+        with pytest.raises(ValueError, match="JSON array"):
+            ChatGPTProvider().parse_export_zip(zip_path)
+
+
+class TestParallelParse:
+    def test_pool_matches_serial_order(self, tmp_path: Path, monkeypatch):
+        conversations = []
+        for i in range(12):
+            conv = json.loads(json.dumps(SAMPLE_CONVERSATIONS[i % 2]))
+            conv["conversation_id"] = f"conv-{i:02d}"
+            conversations.append(conv)
+        conversations.insert(5, {"broken": True})
+        zip_path = _make_export_zip(tmp_path, conversations)
+
+        serial = ChatGPTProvider().parse_export_zip(zip_path)
+        monkeypatch.setattr(parallel, "PARALLEL_MIN", 4)
+        monkeypatch.setattr(parallel, "PARSE_BATCH", 3)
+        pooled = ChatGPTProvider().parse_export_zip(zip_path)
+
+        assert [c.remote_id for c in pooled] == [c.remote_id for c in serial]
+        assert pooled[0].messages == serial[0].messages
+
+
+class TestWalkMessageTree:
+    def test_follows_last_child(self):
+        mapping = {
+            "root": {"parent": None, "children": ["a", "b"]},
+            "a": {"parent": "root", "children": []},
+            "b": {"parent": "root", "children": ["c"]},
+            "c": {"parent": "b", "children": []},
+        }
+        nodes = chatgpt._walk_message_tree(mapping)
+        assert nodes == [mapping["root"], mapping["b"], mapping["c"]]
+
+    def test_cycle_terminates(self):
+        mapping = {
+            "root": {"parent": None, "children": ["a"]},
+            "a": {"parent": "root", "children": ["root"]},
+        }
+        assert len(chatgpt._walk_message_tree(mapping)) == 2
+
+    def test_no_root(self):
+        mapping = {"a": {"parent": "b", "children": []}, "b": {"parent": "a", "children": []}}
+        assert chatgpt._walk_message_tree(mapping) == []
+
+
+class TestExtractContent:
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            ({"content_type": "text", "parts": ["Hello", "World"]}, "Hello\nWorld"),
+            ({"content_type": "text", "parts": ["  padded  "]}, "padded"),
+            ({"content_type": "text", "parts": []}, ""),
+            ({"content_type": "text", "parts": None}, ""),
+            (
+                {"content_type": "text", "parts": ["a", {"content_type": "text", "text": "b"}]},
+                "a\nb",
+            ),
+            ({"content_type": "text", "parts": ["a", {"image": 1}]}, "a"),
+            ({"content_type": "code", "text": " x = 1 \n"}, "x = 1"),
+        ],
+    )
+    def test_extract(self, content, expected):
+        assert chatgpt._extract_content({"content": content}) == expected
@@ -29,6 +29,39 @@ class TestSaveAndGet:
         content = store.get("test", start_line=2, end_line=4)
         assert content == "line2\nline3\nline4"
 
+    def test_get_line_range_to_end(self, tmp_path: Path):
+        store = ContextStore(tmp_path / "contexts")
+        store.save("test", "line1\nline2\nline3\n")
+
+        assert store.get("test", start_line=2) == "line2\nline3\n"
+        assert store.get("test", end_line=1) == "line1"
+        assert store.get("test", start_line=10) == ""
+
+    def test_iter_range_multibyte_across_buffers(self, tmp_path: Path):
+        store = ContextStore(tmp_path / "contexts")
+        content = "\n".join(f"строка {i} — ü" for i in range(50))
+        store.save("test", content)
+
+        chunks = list(store.iter_range("test", 5, 40, buf=7))
+        assert len(chunks) > 1
+        assert "".join(chunks) == "\n".join(content.split("\n")[4:40])
+
+    def test_get_line_range_rebuilds_missing_index(self, tmp_path: Path):
+        store = ContextStore(tmp_path / "contexts")
+        store.save("test", "a\nb\nc")
+        (tmp_path / "contexts" / "test.idx").unlink()
+
+        assert store.get("test", start_line=2, end_line=3) == "b\nc"
+        assert (tmp_path / "contexts" / "test.idx").exists()
+
+    def test_crlf_range_matches_full_get(self, tmp_path: Path):
+        store = ContextStore(tmp_path / "contexts")
+        store.save("test", "a\r\nb\r\nc\rd")
+
+        assert store.get("test") == "a\nb\nc\nd"
+        assert store.get("test", start_line=1, end_line=2) == "a\nb"
+        assert store.get("test", start_line=3) == "c\nd"
+
     def test_get_not_found(self, tmp_path: Path):
         store = ContextStore(tmp_path / "contexts")
         result = store.get("missing")
@@ -64,6 +97,7 @@ class TestDelete:
         store.save("test", "content")
         assert store.delete("test") is True
         assert "not found" in store.get("test").lower()
+        assert not (tmp_path / "contexts" / "test.idx").exists()
 
     def test_delete_nonexistent(self, tmp_path: Path):
         store = ContextStore(tmp_path / "contexts")
@@ -2,6 +2,8 @@
 
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from anticlaw.providers.embedding.base import EmbeddingInfo, EmbeddingProvider
 from anticlaw.providers.embedding.ollama import OllamaEmbeddingProvider
 
@@ -65,7 +67,7 @@ class TestOllamaEmbeddingProvider:
         mock_resp.json.return_value = {"embeddings": [[0.1, 0.2, 0.3]]}
         mock_resp.raise_for_status = MagicMock()
 
-        with patch("httpx.post", return_value=mock_resp) as mock_post:
+        with patch("httpx.Client.post", return_value=mock_resp) as mock_post:
             result = p.embed("hello world")
 
         assert result == [0.1, 0.2, 0.3]
@@ -83,7 +85,7 @@ class TestOllamaEmbeddingProvider:
         }
         mock_resp.raise_for_status = MagicMock()
 
-        with patch("httpx.post", return_value=mock_resp) as mock_post:
+        with patch("httpx.Client.post", return_value=mock_resp) as mock_post:
             result = p.embed_batch(["hello", "world"])
 
         assert len(result) == 2
@@ -102,7 +104,176 @@ class TestOllamaEmbeddingProvider:
         mock_resp.json.return_value = {"embeddings": [[1.0]]}
         mock_resp.raise_for_status = MagicMock()
 
-        with patch("httpx.post", return_value=mock_resp) as mock_post:
+        with patch("httpx.Client.post", return_value=mock_resp) as mock_post:
             p.embed("test")
 
         assert mock_post.call_args[1]["json"]["model"] == "mxbai-embed-large"
+
+    def test_client_reused_across_calls(self):
+        p = OllamaEmbeddingProvider({"base_url": "http://host:11434/"})
+        mock_resp = MagicMock()
+        mock_resp.json.return_value = {"embeddings": [[1.0]]}
+
+        with patch("httpx.Client.post", return_value=mock_resp) as mock_post:
+            p.embed("a")
+            client = p._client
+            p.embed_batch(["b"])
+
+        assert p._client is client
+        assert str(client.base_url) == "http://host:11434"
+        assert mock_post.call_count == 2
+        assert mock_post.call_args[1]["timeout"] == 120.0
+
+    def test_batch_timeout_configurable(self):
+        p = OllamaEmbeddingProvider({"batch_timeout": 300})
+        mock_resp = MagicMock()
+        mock_resp.json.return_value = {"embeddings": [[1.0]]}
+
+        with patch("httpx.Client.post", return_value=mock_resp) as mock_post:
+            p.embed_batch(["a"])
+
+        assert mock_post.call_args[1]["timeout"] == 300.0
+
+    def test_context_manager_closes_client(self):
+        with OllamaEmbeddingProvider() as p:
+            client = p._get_client()
+        assert p._client is None
+        assert client.is_closed
+
+
+class TestEmbeddingCache:
+    @staticmethod
+    def _echo_post(calls: list):
+        def post(self, url, json, **kwargs):
+            inputs = json["input"] if isinstance(json["input"], list) else [json["input"]]
+            calls.append(inputs)
+            resp = MagicMock()
+            resp.json.return_value = {"embeddings": [[float(len(t))] for t in inputs]}
+            return resp
+
+        return post
+
+    def test_embed_cached(self):
+        p = OllamaEmbeddingProvider()
+        calls: list = []
+        with patch("httpx.Client.post", self._echo_post(calls)):
+            assert p.embed("abc") == [3.0]
+            assert p.embed("abc") == [3.0]
+        assert len(calls) == 1
+
+    def test_batch_sends_only_unique_misses(self):
+        p = OllamaEmbeddingProvider()
+        calls: list = []
+        with patch("httpx.Client.post", self._echo_post(calls)):
+            p.embed("a")
+            result = p.embed_batch(["a", "bb", "ccc", "bb"])
+
+        assert result == [[1.0], [2.0], [3.0], [2.0]]
+        assert calls == [["a"], ["bb", "ccc"]]
+
+    def test_batch_all_cached_no_request(self):
+        p = OllamaEmbeddingProvider()
+        calls: list = []
+        with patch("httpx.Client.post", self._echo_post(calls)):
+            p.embed_batch(["x", "yy"])
+            assert p.embed_batch(["yy", "x"]) == [[2.0], [1.0]]
+        assert len(calls) == 1
+
+    def test_returned_vectors_are_copies(self):
+        p = OllamaEmbeddingProvider()
+        calls: list = []
+        with patch("httpx.Client.post", self._echo_post(calls)):
+            p.embed("abc")[0] = 0.0
+            batch = p.embed_batch(["abc", "abc"])
+            batch[0][0] = 0.0
+            assert batch[1] == [3.0]
+            assert p.embed("abc") == [3.0]
+        assert len(calls) == 1
+
+    def test_lru_eviction(self):
+        p = OllamaEmbeddingProvider({"cache_size": 2})
+        calls: list = []
+        with patch("httpx.Client.post", self._echo_post(calls)):
+            p.embed("a")
+            p.embed("bb")
+            p.embed("a")  # refresh "a"
+            p.embed("ccc")  # evicts "bb"
+            p.embed("a")
+            p.embed("bb")
+        assert [c[0] for c in calls] == ["a", "bb", "ccc", "bb"]
+
+    def test_cache_disabled(self):
+        p = OllamaEmbeddingProvider({"cache_size": 0})
+        calls: list = []
+        with patch("httpx.Client.post", self._echo_post(calls)):
+            p.embed("a")
+            p.embed("a")
+        assert len(calls) == 2
+
+
+class TestEmbedBatchArray:
+    def test_float32_matrix(self):
+        np = pytest.importorskip("numpy")
+        p = OllamaEmbeddingProvider()
+        mock_resp = MagicMock()
+        mock_resp.json.return_value = {"embeddings": [[0.5, 1.5], [2.5, 3.5]]}
+
+        with patch("httpx.Client.post", return_value=mock_resp):
+            result = p.embed_batch_array(["a", "b"])
+
+        assert result.dtype == np.float32
+        assert result.shape == (2, 2)
+        assert result.tolist() == [[0.5, 1.5], [2.5, 3.5]]
+
+    def test_empty_keeps_dimensions(self):
+        pytest.importorskip("numpy")
+        result = OllamaEmbeddingProvider({"dimensions": 384}).embed_batch_array([])
+        assert result.shape == (0, 384)
+
+
+class TestParallelBatch:
+    @staticmethod
+    def _fake_post(calls: list):
+        async def post(self, url, json):
+            calls.append(json["input"])
+            resp = MagicMock()
+            resp.json.return_value = {"embeddings": [[float(len(t))] for t in json["input"]]}
+            return resp
+
+        return post
+
+    def test_splits_and_preserves_order(self):
+        p = OllamaEmbeddingProvider()
+        texts = ["a" * i for i in range(1, 11)]
+        calls: list = []
+
+        with patch("httpx.AsyncClient.post", self._fake_post(calls)):
+            result = p.embed_batch_parallel(texts, concurrency=4)
+
+        assert result == [[float(i)] for i in range(1, 11)]
+        assert len(calls) == 4
+        assert [t for chunk in calls for t in chunk] == texts
+
+    def test_concurrency_capped_by_input(self):
+        p = OllamaEmbeddingProvider()
+        calls: list = []
+
+        with patch("httpx.AsyncClient.post", self._fake_post(calls)):
+            result = p.embed_batch_parallel(["x", "yy"], concurrency=8)
+
+        assert result == [[1.0], [2.0]]
+        assert len(calls) == 2
+
+    def test_cached_texts_not_sent(self):
+        p = OllamaEmbeddingProvider()
+        calls: list = []
+
+        with patch("httpx.AsyncClient.post", self._fake_post(calls)):
+            p.embed_batch_parallel(["a", "bb"])
+            result = p.embed_batch_parallel(["bb", "ccc", "a"])
+
+        assert result == [[2.0], [3.0], [1.0]]
+        assert calls[-1] == ["ccc"]
+
+    def test_empty(self):
+        assert OllamaEmbeddingProvider().embed_batch_parallel([]) == []
@@ -1,5 +1,6 @@
 """Tests for anticlaw.providers.llm.gemini."""
 
+import io
 import json
 import zipfile
 from datetime import datetime, timezone
@@ -385,6 +386,31 @@ class TestParseTakeoutZip:
         with pytest.raises(FileNotFoundError, match="No Gemini conversation"):
             provider.parse_takeout_zip(zip_path)
 
+    def test_gemini_paths_preferred(self, tmp_path: Path):
+        zip_path = tmp_path / "mixed.zip"
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr("Other/a/conversation.json", json.dumps(SAMPLE_CONVERSATION_2))
+            zf.writestr(
+                "Takeout/Gemini Apps/Conversations/b/conversation.json",
+                json.dumps(SAMPLE_CONVERSATION_1),
+            )
+
+        chats = GeminiProvider().parse_takeout_zip(zip_path)
+        assert [c.remote_id for c in chats] == [SAMPLE_CONVERSATION_1["id"]]
+
+    def test_any_conversation_json_fallback(self, tmp_path: Path):
+        zip_path = _make_takeout_zip(
+            tmp_path,
+            [("b", SAMPLE_CONVERSATION_2), ("a", SAMPLE_CONVERSATION_1)],
+            base_dir="Export/Chats",
+        )
+
+        chats = GeminiProvider().parse_takeout_zip(zip_path)
+        assert [c.remote_id for c in chats] == [
+            SAMPLE_CONVERSATION_1["id"],
+            SAMPLE_CONVERSATION_2["id"],
+        ]
+
     def test_malformed_conversation_skipped(self, tmp_path: Path):
         zip_path = tmp_path / "mixed.zip"
         with zipfile.ZipFile(zip_path, "w") as zf:
@@ -467,6 +493,41 @@ class TestUnixTimestamps:
         assert chat.messages[0].timestamp == datetime(2025, 2, 18, 14, 30, tzinfo=timezone.utc)
 
 
+class TestParseTimestamp:
+    def test_iso_z(self):
+        from anticlaw.providers.llm.gemini import _parse_timestamp
+
+        assert _parse_timestamp("2025-02-18T14:30:00Z") == datetime(
+            2025, 2, 18, 14, 30, tzinfo=timezone.utc
+        )
+
+    def test_naive_iso_is_utc(self):
+        from anticlaw.providers.llm.gemini import _parse_timestamp
+
+        assert _parse_timestamp("2025-02-18T14:30:00").tzinfo is not None
+
+    def test_numeric_string(self):
+        from anticlaw.providers.llm.gemini import _parse_timestamp
+
+        assert _parse_timestamp(" 1739889000 ") == datetime(
+            2025, 2, 18, 14, 30, tzinfo=timezone.utc
+        )
+
+    @pytest.mark.parametrize("value", [None, "", "  ", "garbage", 1e20, {"a": 1}])
+    def test_invalid_returns_default(self, value):
+        from anticlaw.providers.llm.gemini import _parse_timestamp
+
+        default = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        assert _parse_timestamp(value, default) is default
+
+    def test_missing_updated_falls_back_to_created(self, tmp_path: Path):
+        conv = {"id": "c1", "create_time": "2025-02-18T14:30:00Z", "messages": []}
+        zip_path = _make_takeout_zip(tmp_path, [("2025-02-18_x", conv)])
+
+        chat = GeminiProvider().parse_takeout_zip(zip_path)[0]
+        assert chat.updated == chat.created
+
+
 class TestContentFormats:
     def test_content_parts_list(self, tmp_path: Path):
         zip_path = _make_takeout_zip(tmp_path, [
@@ -502,6 +563,21 @@ class TestContentFormats:
         assert messages[0].content == "Hello from AI Studio"
         assert messages[1].content == "Hello! How can I help?"
 
+    def test_mixed_shapes_in_one_conversation(self, tmp_path: Path):
+        conv = {
+            "id": "mixed",
+            "messages": [
+                {"role": "user", "text": "  plain  "},
+                {"role": "model", "text": " ", "content": "from content"},
+                {"role": "user", "content": ["a", {"text": "b"}, {"text": ""}]},
+                {"role": "model", "content": [{"text": " "}], "parts": [{"text": "api"}]},
+            ],
+        }
+        zip_path = _make_takeout_zip(tmp_path, [("2025-02-19_mixed", conv)])
+
+        messages = GeminiProvider().parse_takeout_zip(zip_path)[0].messages
+        assert [m.content for m in messages] == ["plain", "from content", "a\nb", "api"]
+
 
 class TestModelExtraction:
     def test_model_from_conversation_metadata(self, tmp_path: Path):
@@ -538,6 +614,24 @@ class TestRoleNormalization:
         chats = provider.parse_takeout_zip(zip_path)
         assert chats[0].messages[1].role == "assistant"
 
+    @pytest.mark.parametrize(
+        ("role", "expected"),
+        [
+            ("user", "human"),
+            ("User", "human"),
+            (" HUMAN ", "human"),
+            ("model", "assistant"),
+            ("Assistant", "assistant"),
+            ("system", ""),
+            ("thought", ""),
+            ("", ""),
+        ],
+    )
+    def test_roles(self, role, expected):
+        from anticlaw.providers.llm.gemini import _normalize_role
+
+        assert _normalize_role(role) == expected
+
 
 class TestScrubbing:
     def test_scrub_flag(self, tmp_path: Path):
@@ -565,6 +659,17 @@ class TestScrubbing:
         msg0 = chats[0].messages[0].content
         assert "sk-ant-" in msg0
 
+    def test_matches_per_message_scrub(self, tmp_path: Path):
+        from anticlaw.providers.llm.claude import scrub_text
+
+        zip_path = _make_takeout_zip(tmp_path, [
+            ("2025-02-18_secret", CONVERSATION_WITH_SECRETS),
+        ])
+        raw = GeminiProvider().parse_takeout_zip(zip_path)[0].messages
+        scrubbed = GeminiProvider().parse_takeout_zip(zip_path, scrub=True)[0].messages
+        assert [m.content for m in scrubbed] == [scrub_text(m.content) for m in raw]
+        assert [m.role for m in scrubbed] == [m.role for m in raw]
+
 
 class TestDirectoryParsing:
     def test_parse_extracted_directory(self, tmp_path: Path):
@@ -584,6 +689,20 @@ class TestDirectoryParsing:
         with pytest.raises(FileNotFoundError, match="No Gemini Conversations"):
             provider.parse_takeout_zip(empty_dir)
 
+    def test_nested_conversations_fallback(self, tmp_path: Path):
+        root = tmp_path / "export"
+        (root / "a-file").mkdir(parents=True)
+        (root / "notes.txt").write_text("x", encoding="utf-8")
+        (root / "a-file" / "conversations").write_text("not a dir", encoding="utf-8")
+        conv_dir = root / "my-gemini" / "conversations" / "2025-02-18_auth"
+        conv_dir.mkdir(parents=True)
+        (conv_dir / "conversation.json").write_text(
+            json.dumps(SAMPLE_CONVERSATION_1), encoding="utf-8"
+        )
+
+        chats = GeminiProvider().parse_takeout_zip(root)
+        assert [c.remote_id for c in chats] == [SAMPLE_CONVERSATION_1["id"]]
+
 
 class TestTitleFromFolderName:
     def test_date_prefix_stripped(self, tmp_path: Path):
@@ -613,3 +732,109 @@ class TestTitleFromFolderName:
         provider = GeminiProvider()
         chats = provider.parse_takeout_zip(zip_path)
         assert chats[0].title == "My Custom Title"
+
+
+class TestStreamingLoad:
+    CONV = {
+        "id": "big-1",
+        "title": "Attachments",
+        "create_time": "2025-02-19T10:00:00Z",
+        "update_time": "2025-02-19T10:01:00Z",
+        "safetyRatings": [{"category": "x", "probability": "LOW"}],
+        "messages": [
+            {
+                "role": "user",
+                "parts": [
+                    {"text": "see image"},
+                    {"inlineData": {"mimeType": "image/png", "data": "QUFB" * 1000}},
+                ],
+                "create_time": "2025-02-19T10:00:00Z",
+            },
+            {
+                "role": "model",
+                "text": "A cat.",
+                "model": "gemini-1.5-pro",
+                "create_time": "2025-02-19T10:01:00Z",
+                "extra": {"a": 1},
+            },
+        ],
+    }
+
+    @pytest.fixture(autouse=True)
+    def stream_everything(self, monkeypatch):
+        from anticlaw.core import jsonutil
+        from anticlaw.providers.llm import gemini
+
+        if not jsonutil.HAS_IJSON:
+            pytest.skip("ijson not installed")
+        monkeypatch.setattr(gemini, "_STREAM_MIN_BYTES", 0)
+
+    def test_unread_fields_dropped(self):
+        from anticlaw.providers.llm.gemini import _stream_conversation
+
+        conv = _stream_conversation(io.BytesIO(json.dumps(self.CONV).encode("utf-8")))
+        assert "safetyRatings" not in conv
+        assert conv["messages"][0]["parts"] == [{"text": "see image"}, {}]
+        assert "extra" not in conv["messages"][1]
+
+    def test_same_result_as_full_load(self, tmp_path: Path, monkeypatch):
+        from anticlaw.providers.llm import gemini
+
+        zip_path = _make_takeout_zip(tmp_path, [("2025-02-19_cat", self.CONV)])
+        streamed = GeminiProvider().parse_takeout_zip(zip_path)
+        monkeypatch.setattr(gemini, "_STREAM_MIN_BYTES", 1 << 40)
+        loaded = GeminiProvider().parse_takeout_zip(zip_path)
+        assert streamed == loaded
+        assert streamed[0].messages[0].content == "see image"
+
+
+class TestParallelParse:
+    def _conversations(self) -> list[tuple[str, dict]]:
+        convs = []
+        for i in range(12):
+            conv = json.loads(json.dumps(SAMPLE_CONVERSATION_1))
+            conv["id"] = f"gem-{i}"
+            convs.append((f"2025-02-{i + 1:02d}_chat", conv))
+        convs.append(("2025-03-01_broken", {"messages": "not a list"}))
+        return convs
+
+    def test_zip_matches_serial(self, tmp_path: Path, monkeypatch):
+        from anticlaw.providers.llm import parallel
+
+        zip_path = _make_takeout_zip(tmp_path, self._conversations())
+        serial = GeminiProvider().parse_takeout_zip(zip_path, scrub=True)
+        monkeypatch.setattr(parallel, "PARALLEL_MIN", 2)
+        monkeypatch.setattr(parallel, "PARSE_BATCH", 5)
+        pooled = GeminiProvider().parse_takeout_zip(zip_path, scrub=True)
+
+        assert [c.remote_id for c in pooled] == [f"gem-{i}" for i in range(12)]
+        assert [c.messages for c in pooled] == [c.messages for c in serial]
+
+    def test_directory_matches_serial(self, tmp_path: Path, monkeypatch):
+        from anticlaw.providers.llm import parallel
+
+        takeout = _make_takeout_dir(tmp_path, self._conversations())
+        serial = GeminiProvider().parse_takeout_zip(takeout)
+        monkeypatch.setattr(parallel, "PARALLEL_MIN", 2)
+        monkeypatch.setattr(parallel, "PARSE_BATCH", 5)
+        pooled = GeminiProvider().parse_takeout_zip(takeout)
+
+        assert [c.remote_id for c in pooled] == [c.remote_id for c in serial]
+        assert len(pooled) == 12
+
+
+class TestJsonBackends:
+    @pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+    def backend(self, request, monkeypatch):
+        from anticlaw.core import jsonutil
+
+        if request.param and not jsonutil.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(jsonutil, "HAS_ORJSON", request.param)
+
+    def test_zip_and_dir_parse_identically(self, tmp_path: Path, backend):
+        convs = [("2025-02-18_a", SAMPLE_CONVERSATION_1), ("2025-02-19_b", SAMPLE_CONVERSATION_2)]
+        from_zip = GeminiProvider().parse_takeout_zip(_make_takeout_zip(tmp_path, convs))
+        from_dir = GeminiProvider().parse_takeout_zip(_make_takeout_dir(tmp_path, convs))
+        assert [c.remote_id for c in from_zip] == [c.remote_id for c in from_dir]
+        assert [c.messages for c in from_zip] == [c.messages for c in from_dir]
@@ -0,0 +1,112 @@
+"""Tests for anticlaw.daemon.journal — ChangeJournal and read_changes."""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from anticlaw.daemon.journal import ChangeJournal, journal_path, read_changes
+
+
+def _started_journal(home: Path) -> ChangeJournal:
+    """A journal whose header says it started at the epoch."""
+    journal = ChangeJournal(home)
+    with patch("anticlaw.daemon.journal.time.time", return_value=0.0):
+        journal.start()
+    return journal
+
+
+class TestChangeJournal:
+    def test_records_relative_paths(self, tmp_path: Path):
+        journal = _started_journal(tmp_path)
+        journal.record(str(tmp_path / "project" / "chat.md"))
+        journal.record(str(tmp_path / "project" / "sub"), is_directory=True)
+
+        changes = read_changes(tmp_path, 0.0)
+        assert changes == {
+            os.path.join("project", "chat.md"),
+            os.path.join("project", "sub") + os.sep,
+        }
+
+    def test_skips_acl_and_outside_paths(self, tmp_path: Path):
+        home = tmp_path / "home"
+        journal = _started_journal(home)
+        journal.record(str(home / ".acl" / "meta.db"))
+        journal.record(str(tmp_path / "elsewhere.md"))
+        journal.record(str(home))
+
+        assert read_changes(home, 0.0) == set()
+
+    def test_record_before_start_ignored(self, tmp_path: Path):
+        journal = ChangeJournal(tmp_path)
+        journal.record(str(tmp_path / "a.md"))
+        assert not journal_path(tmp_path).exists()
+
+    def test_close_deletes_journal(self, tmp_path: Path):
+        journal = ChangeJournal(tmp_path)
+        journal.start()
+        journal.close()
+        assert not journal_path(tmp_path).exists()
+        assert read_changes(tmp_path, 0.0) is None
+
+    def test_overflow_restarts_journal(self, tmp_path: Path):
+        with patch("anticlaw.daemon.journal.time.time", return_value=100.0):
+            journal = ChangeJournal(tmp_path, max_entries=2)
+            journal.start()
+            journal.record(str(tmp_path / "a.md"))
+            journal.record(str(tmp_path / "b.md"))
+        assert read_changes(tmp_path, 100.0) == {"a.md", "b.md"}
+
+        journal.record(str(tmp_path / "c.md"))
+        # Restarted after the last backup: can no longer vouch for it
+        assert read_changes(tmp_path, 100.0) is None
+        journal.close()
+
+    def test_root_directory_event_restarts_journal(self, tmp_path: Path):
+        with patch("anticlaw.daemon.journal.time.time", return_value=100.0):
+            journal = ChangeJournal(tmp_path)
+            journal.start()
+            journal.record(str(tmp_path / "a.md"))
+            journal.record(str(tmp_path))
+        assert read_changes(tmp_path, 100.0) == {"a.md"}
+
+        journal.record(str(tmp_path), is_directory=True)
+        assert read_changes(tmp_path, 100.0) is None
+        journal.close()
+
+
+class TestReadChanges:
+    def _write(self, home: Path, header: dict, lines: list[str]) -> None:
+        path = journal_path(home)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(header) + "\n" + "".join(lines), encoding="utf-8")
+
+    def test_missing_journal(self, tmp_path: Path):
+        assert read_changes(tmp_path, 0.0) is None
+
+    def test_filters_by_time(self, tmp_path: Path):
+        self._write(
+            tmp_path,
+            {"started": 10.0, "pid": os.getpid()},
+            ["15.000\told.md\n", "20.000\tnew.md\n"],
+        )
+        assert read_changes(tmp_path, 20.0) == {"new.md"}
+
+    def test_started_after_since(self, tmp_path: Path):
+        self._write(tmp_path, {"started": 50.0, "pid": os.getpid()}, [])
+        assert read_changes(tmp_path, 40.0) is None
+
+    def test_dead_writer(self, tmp_path: Path):
+        self._write(tmp_path, {"started": 10.0, "pid": os.getpid() + 1}, [])
+        with patch("anticlaw.daemon.journal.is_process_running", return_value=False):
+            assert read_changes(tmp_path, 20.0) is None
+
+    def test_partial_line(self, tmp_path: Path):
+        self._write(tmp_path, {"started": 10.0, "pid": os.getpid()}, ["20.000\thalf"])
+        assert read_changes(tmp_path, 20.0) is None
+
+    def test_corrupt_header(self, tmp_path: Path):
+        path = journal_path(tmp_path)
+        path.parent.mkdir(parents=True)
+        path.write_text("not json\n", encoding="utf-8")
+        assert read_changes(tmp_path, 0.0) is None
@@ -0,0 +1,73 @@
+"""Tests for anticlaw.core.jsonutil."""
+
+import io
+import json
+
+import pytest
+
+from anticlaw.core import jsonutil
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param and not jsonutil.HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(jsonutil, "HAS_ORJSON", request.param)
+    return request.param
+
+
+class TestLoads:
+    def test_bytes_and_str(self, backend):
+        doc = {"title": "Привет", "n": 1.5, "items": [1, None, True]}
+        raw = json.dumps(doc, ensure_ascii=False)
+        assert jsonutil.loads(raw) == doc
+        assert jsonutil.loads(raw.encode("utf-8")) == doc
+
+    def test_invalid_raises_value_error(self, backend):
+        with pytest.raises(json.JSONDecodeError):
+            jsonutil.loads(b"{not json")
+
+    def test_lone_surrogate_escape(self, backend):
+        raw = json.dumps({"name": "bad\udcff.md"})
+        assert jsonutil.loads(raw.encode("utf-8")) == {"name": "bad\udcff.md"}
+
+
+class TestDumps:
+    DOC = {"chats": {"c1": "Проект"}, "projects": {}, "scraped_at": "2026-01-01T00:00:00Z"}
+
+    def test_indent_matches_stdlib_layout(self, backend):
+        expected = json.dumps(self.DOC, indent=2, ensure_ascii=False).encode("utf-8")
+        assert jsonutil.dumps(self.DOC, indent=True) == expected
+
+    def test_compact(self, backend):
+        assert jsonutil.dumps({"a": [1, "é"]}) == '{"a":[1,"é"]}'.encode()
+
+    def test_lone_surrogate_round_trips(self, backend):
+        data = jsonutil.dumps({"name": "bad\udcff.md"}, indent=True)
+        assert jsonutil.loads(data) == {"name": "bad\udcff.md"}
+
+
+@pytest.fixture(params=[True, False], ids=["ijson", "loads"])
+def streaming(request, monkeypatch):
+    if request.param and not jsonutil.HAS_IJSON:
+        pytest.skip("ijson not installed")
+    monkeypatch.setattr(jsonutil, "HAS_IJSON", request.param)
+    return request.param
+
+
+class TestIterArray:
+    def test_yields_items(self, streaming):
+        items = [{"uuid": "a", "n": 1.5}, {"uuid": "b", "title": "Привет"}]
+        stream = io.BytesIO(json.dumps(items, ensure_ascii=False).encode("utf-8"))
+        assert list(jsonutil.iter_array(stream)) == items
+
+    def test_empty_array(self, streaming):
+        assert list(jsonutil.iter_array(io.BytesIO(b"[]"))) == []
+
+    def test_not_an_array(self, streaming):
+        with pytest.raises(ValueError, match="JSON array"):
+            list(jsonutil.iter_array(io.BytesIO(b'{"uuid": "a"}')))
+
+    def test_malformed(self, streaming):
+        with pytest.raises(ValueError):
+            list(jsonutil.iter_array(io.BytesIO(b'[{"uuid": "a"}, {')))
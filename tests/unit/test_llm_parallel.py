@@ -0,0 +1,32 @@
+"""Tests for anticlaw.providers.llm.parallel."""
+
+from __future__ import annotations
+
+from anticlaw.providers.llm import parallel
+
+
+def _tag_batch(items: list[int], tag: str) -> list[str]:
+    return [f"{tag}{i}" for i in items]
+
+
+class TestParseBatches:
+    def test_small_input_single_call(self):
+        calls = []
+
+        def parse(items, tag):
+            calls.append(list(items))
+            return _tag_batch(items, tag)
+
+        assert parallel.parse_batches(parse, iter(range(3)), "x") == ["x0", "x1", "x2"]
+        assert calls == [[0, 1, 2]]
+
+    def test_empty_input(self):
+        assert parallel.parse_batches(_tag_batch, [], "x") == []
+
+    def test_pool_preserves_order(self, monkeypatch):
+        monkeypatch.setattr(parallel, "PARALLEL_MIN", 4)
+        monkeypatch.setattr(parallel, "PARSE_BATCH", 3)
+
+        result = parallel.parse_batches(_tag_batch, iter(range(25)), "c")
+
+        assert result == [f"c{i}" for i in range(25)]
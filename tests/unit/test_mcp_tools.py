@@ -7,6 +7,7 @@ from anticlaw.core.meta_db import MetaDB
 from anticlaw.core.models import Chat, ChatMessage, Insight, Project
 from anticlaw.core.storage import ChatStorage
 from anticlaw.mcp.server import (
+    _get_home,
     forget_impl,
     ping_impl,
     projects_impl,
@@ -45,6 +46,16 @@ def _setup_home(tmp_path: Path) -> Path:
     return home
 
 
+class TestGetHome:
+    def test_resolved_once_per_process(self, tmp_path: Path, monkeypatch):
+        _get_home.cache_clear()
+        monkeypatch.setenv("ACL_HOME", str(tmp_path / "first"))
+        first = _get_home()
+        monkeypatch.setenv("ACL_HOME", str(tmp_path / "second"))
+        assert _get_home() == first
+        _get_home.cache_clear()
+
+
 class TestPing:
     def test_ping_ok(self, tmp_path: Path):
         home = _setup_home(tmp_path)
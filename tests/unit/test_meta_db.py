@@ -148,6 +148,7 @@ class TestIndexProject:
 
         projects = db.list_projects()
         assert len(projects) == 2
+        assert db.count_projects() == 2
         db.close()
 
 
@@ -341,6 +342,14 @@ class TestListChats:
         assert len(chats) == 3
         db.close()
 
+    def test_count_chats(self, tmp_path: Path):
+        db = MetaDB(tmp_path / "meta.db")
+        assert db.count_chats() == 0
+        for i in range(3):
+            db.index_chat(_make_chat(id=f"c{i}"), tmp_path / f"c{i}.md")
+        assert db.count_chats() == 3
+        db.close()
+
     def test_list_by_project(self, tmp_path: Path):
         db = MetaDB(tmp_path / "meta.db")
         db.index_chat(_make_chat(id="c1"), tmp_path / "a.md", "proj-a")
@@ -1,5 +1,6 @@
 """Tests for anticlaw.core.models."""
 
+import pickle
 from datetime import datetime, timezone
 
 from anticlaw.core.models import (
@@ -31,6 +32,11 @@ class TestChatMessage:
         msg = ChatMessage(role="assistant", content="hi", timestamp=ts)
         assert msg.timestamp == ts
 
+    def test_slotted_and_picklable(self):
+        msg = ChatMessage(role="human", content="hello")
+        assert not hasattr(msg, "__dict__")
+        assert pickle.loads(pickle.dumps(msg)) == msg
+
 
 class TestChat:
     def test_defaults(self):
@@ -103,6 +109,11 @@ class TestProviderModels:
         cd = ChatData(remote_id="r1", title="Test", provider="claude")
         assert cd.messages == []
 
+    def test_chat_data_slotted_and_picklable(self):
+        cd = ChatData(remote_id="r1", messages=[ChatMessage(role="human", content="hi")])
+        assert not hasattr(cd, "__dict__")
+        assert pickle.loads(pickle.dumps(cd)) == cd
+
     def test_sync_result(self):
         sr = SyncResult(provider="claude", pulled=5, pushed=2)
         assert sr.conflicts == 0
@@ -1,5 +1,7 @@
 """Tests for anticlaw.providers.registry."""
 
+import pytest
+
 from anticlaw.providers.registry import ProviderEntry, ProviderRegistry
 
 
@@ -94,3 +96,21 @@ class TestProviderRegistry:
 
         entry = reg.get_entry("llm", "dummy")
         assert entry.extras == []
+        assert not hasattr(entry, "__dict__")
+
+    def test_reregister_replaces_entry(self):
+        reg = ProviderRegistry()
+        reg.register("llm", "dummy", _DummyProvider)
+        reg.register("llm", "dummy", _AnotherProvider)
+
+        assert reg.get_entry("llm", "dummy").cls is _AnotherProvider
+        assert [e.cls for e in reg.list_family("llm")] == [_AnotherProvider]
+
+    def test_unknown_family_and_provider_messages(self):
+        reg = ProviderRegistry()
+        reg.register("llm", "dummy", _DummyProvider)
+
+        with pytest.raises(KeyError, match="Unknown provider family"):
+            reg.get_entry("backup", "dummy")
+        with pytest.raises(KeyError, match="Unknown provider: llm/"):
+            reg.get_entry("llm", "missing")
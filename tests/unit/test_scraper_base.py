@@ -35,6 +35,10 @@ class TestScrapedMapping:
         assert m.chats["uuid-1"] == "my-project"
         assert m.projects["proj-1"]["name"] == "My Project"
 
+    def test_slotted(self):
+        assert not hasattr(ScrapedMapping(), "__dict__")
+        assert not hasattr(ScraperInfo(display_name="X", base_url="https://x.com"), "__dict__")
+
 
 class TestScraperProviderProtocol:
     def test_protocol_is_runtime_checkable(self):
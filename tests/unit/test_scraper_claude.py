@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -83,8 +84,8 @@ def _make_pw_mock(
         mock_browser
     )
 
-    # Setup evaluate to return paginated chats
-    mock_page.evaluate.side_effect = [
+    # Setup evaluate to return paginated chats per starred flag
+    mock_page.evaluate.return_value = [
         starred_chats if starred_chats is not None else [],
         unstarred_chats
         if unstarred_chats is not None
@@ -131,15 +132,29 @@ class TestProcessChats:
         scraper._process_chats(ALL_CHATS)
 
         assert len(scraper._projects) == 2
-        assert (
-            scraper._projects["proj-aaa"]["name"]
-            == "My Project"
+        assert scraper._projects["proj-aaa"] == "My Project"
+        assert scraper._projects["proj-bbb"] == "Another Project"
+
+    def test_stores_project_uuid_per_chat(self):
+        scraper = ClaudeScraper()
+        scraper._process_chats(
+            [
+                {"uuid": "c1", "project": None},
+                {"uuid": "c2", "project": {"uuid": "p1", "name": "P"}},
+            ],
         )
-        assert (
-            scraper._projects["proj-bbb"]["name"]
-            == "Another Project"
+
+        assert scraper._chats == {"c1": "", "c2": "p1"}
+
+    def test_missing_project_name_falls_back(self):
+        scraper = ClaudeScraper()
+        scraper._process_chats(
+            [{"uuid": "c1", "project": {"uuid": "p1", "name": None}}],
         )
 
+        assert scraper._projects == {"p1": "Untitled"}
+        assert scraper._build_mapping().chats == {"c1": "untitled"}
+
     def test_skips_chats_without_uuid(self):
         scraper = ClaudeScraper()
         count = scraper._process_chats(
@@ -269,7 +284,7 @@ class TestFetchAllChats:
         scraper = ClaudeScraper()
         scraper._org_id = ORG_UUID
         mock_page = MagicMock()
-        mock_page.evaluate.side_effect = [
+        mock_page.evaluate.return_value = [
             CHATS_STARRED,
             CHATS_UNSTARRED,
         ]
@@ -278,27 +293,36 @@ class TestFetchAllChats:
 
         assert len(scraper._chats) == 4
         assert len(scraper._projects) == 2
-        assert mock_page.evaluate.call_count == 2
+        assert mock_page.evaluate.call_count == 1
 
     def test_passes_correct_args(self):
         scraper = ClaudeScraper()
         scraper._org_id = ORG_UUID
         mock_page = MagicMock()
-        mock_page.evaluate.side_effect = [[], []]
+        mock_page.evaluate.return_value = [[], []]
 
         scraper._fetch_all_chats(mock_page)
 
-        calls = mock_page.evaluate.call_args_list
-        # First call: starred=True
-        assert calls[0][0][1] == [ORG_UUID, True]
-        # Second call: starred=False
-        assert calls[1][0][1] == [ORG_UUID, False]
+        # One call for both flags: starred first, then unstarred
+        mock_page.evaluate.assert_called_once()
+        assert mock_page.evaluate.call_args[0][1] == [ORG_UUID, [True, False], 4]
 
     def test_handles_non_list_response(self):
         scraper = ClaudeScraper()
         scraper._org_id = ORG_UUID
         mock_page = MagicMock()
-        mock_page.evaluate.side_effect = [None, "bad"]
+        mock_page.evaluate.return_value = [None, "bad"]
+
+        scraper._fetch_all_chats(mock_page)
+
+        assert len(scraper._chats) == 0
+
+    @pytest.mark.parametrize("result", [None, "bad", [], [[]]])
+    def test_handles_malformed_result(self, result):
+        scraper = ClaudeScraper()
+        scraper._org_id = ORG_UUID
+        mock_page = MagicMock()
+        mock_page.evaluate.return_value = result
 
         scraper._fetch_all_chats(mock_page)
 
@@ -308,7 +332,7 @@ class TestFetchAllChats:
         scraper = ClaudeScraper()
         scraper._org_id = ORG_UUID
         mock_page = MagicMock()
-        mock_page.evaluate.side_effect = [
+        mock_page.evaluate.return_value = [
             [ALL_CHATS[0]],  # starred
             [ALL_CHATS[0], ALL_CHATS[1]],  # unstarred (dup)
         ]
@@ -321,7 +345,7 @@ class TestFetchAllChats:
         scraper = ClaudeScraper()
         scraper._org_id = ORG_UUID
         mock_page = MagicMock()
-        mock_page.evaluate.side_effect = [[], []]
+        mock_page.evaluate.return_value = [[], []]
 
         scraper._fetch_all_chats(mock_page)
 
@@ -332,16 +356,8 @@ class TestFetchAllChats:
 class TestBuildMapping:
     def test_maps_chats_to_project_folders(self):
         scraper = ClaudeScraper()
-        scraper._chats = {
-            "c1": {
-                "uuid": "c1",
-                "project": {
-                    "uuid": "p1",
-                    "name": "My Project",
-                },
-            },
-        }
-        scraper._projects = {"p1": {"name": "My Project"}}
+        scraper._chats = {"c1": "p1"}
+        scraper._projects = {"p1": "My Project"}
 
         mapping = scraper._build_mapping()
 
@@ -349,17 +365,8 @@ class TestBuildMapping:
 
     def test_skips_chats_without_project(self):
         scraper = ClaudeScraper()
-        scraper._chats = {
-            "c1": {"uuid": "c1", "project": None},
-            "c2": {
-                "uuid": "c2",
-                "project": {
-                    "uuid": "p1",
-                    "name": "Proj",
-                },
-            },
-        }
-        scraper._projects = {"p1": {"name": "Proj"}}
+        scraper._chats = {"c1": "", "c2": "p1"}
+        scraper._projects = {"p1": "Proj"}
 
         mapping = scraper._build_mapping()
 
@@ -369,25 +376,10 @@ class TestBuildMapping:
 
     def test_multiple_projects(self):
         scraper = ClaudeScraper()
-        scraper._chats = {
-            "c1": {
-                "uuid": "c1",
-                "project": {
-                    "uuid": "pa",
-                    "name": "Project A",
-                },
-            },
-            "c2": {
-                "uuid": "c2",
-                "project": {
-                    "uuid": "pb",
-                    "name": "Project B",
-                },
-            },
-        }
+        scraper._chats = {"c1": "pa", "c2": "pb"}
         scraper._projects = {
-            "pa": {"name": "Project A"},
-            "pb": {"name": "Project B"},
+            "pa": "Project A",
+            "pb": "Project B",
         }
 
         mapping = scraper._build_mapping()
@@ -406,22 +398,29 @@ class TestBuildMapping:
 
     def test_projects_have_instructions_key(self):
         scraper = ClaudeScraper()
-        scraper._chats = {
-            "c1": {
-                "uuid": "c1",
-                "project": {
-                    "uuid": "p1",
-                    "name": "Proj",
-                },
-            },
-        }
-        scraper._projects = {"p1": {"name": "Proj"}}
+        scraper._chats = {"c1": "p1"}
+        scraper._projects = {"p1": "Proj"}
 
         mapping = scraper._build_mapping()
 
         assert "instructions" in mapping.projects["p1"]
         assert mapping.projects["p1"]["instructions"] == ""
 
+    def test_slugifies_each_project_name_once(self):
+        scraper = ClaudeScraper()
+        scraper._chats = {f"c{i}": f"p{i % 2}" for i in range(6)}
+        scraper._projects = {"p0": "Proj 0", "p1": "Proj 1"}
+
+        with patch(
+            "anticlaw.providers.scraper.claude.safe_filename",
+            side_effect=lambda name: name.lower().replace(" ", "-"),
+        ) as slug:
+            mapping = scraper._build_mapping()
+
+        assert slug.call_count == 2
+        assert mapping.chats["c4"] == "proj-0"
+        assert mapping.chats["c5"] == "proj-1"
+
 
 class TestScrape:
     @patch("builtins.print")
@@ -465,23 +464,27 @@ class TestScrape:
             "http://localhost:9222"
         )
 
-        # Interceptor registered
+        # Interceptor registered, then detached before pagination
         mock_page.on.assert_called_once_with(
             "response", scraper._handle_response
         )
+        mock_page.remove_listener.assert_called_once_with(
+            "response", scraper._handle_response
+        )
 
         # Navigated to claude.ai
         mock_page.goto.assert_called_once_with(
-            "https://claude.ai"
+            "https://claude.ai", wait_until="commit"
         )
 
-        # Waited for networkidle
+        # Org ID already known: no polling, DOM ready is enough
+        mock_page.wait_for_timeout.assert_not_called()
         mock_page.wait_for_load_state.assert_called_once_with(
-            "networkidle"
+            "domcontentloaded"
         )
 
-        # Paginated fetch (2 evaluate calls)
-        assert mock_page.evaluate.call_count == 2
+        # Paginated fetch (starred and unstarred in one evaluate call)
+        assert mock_page.evaluate.call_count == 1
 
         # Summary printed
         args = [str(c) for c in mock_print.call_args_list]
@@ -507,7 +510,7 @@ class TestScrape:
         page_other.url = "https://google.com"
         page_claude = MagicMock()
         page_claude.url = "https://claude.ai/chat/123"
-        page_claude.evaluate.side_effect = [
+        page_claude.evaluate.return_value = [
             CHATS_STARRED,
             CHATS_UNSTARRED,
         ]
@@ -543,7 +546,7 @@ class TestScrape:
         mock_context = MagicMock()
         page_other = MagicMock()
         page_other.url = "https://google.com"
-        page_other.evaluate.side_effect = [
+        page_other.evaluate.return_value = [
             CHATS_STARRED,
             CHATS_UNSTARRED,
         ]
@@ -562,7 +565,7 @@ class TestScrape:
 
         page_other.on.assert_called_once()
         page_other.goto.assert_called_once_with(
-            "https://claude.ai"
+            "https://claude.ai", wait_until="commit"
         )
 
     def test_no_contexts_raises(self):
@@ -591,7 +594,7 @@ class TestScrape:
 
     def test_raises_if_org_id_not_discovered(self):
         scraper = ClaudeScraper()
-        mock_pw, _ = _make_pw_mock()
+        mock_pw, mock_page = _make_pw_mock()
 
         with (
             patch.object(
@@ -606,6 +609,8 @@ class TestScrape:
         ):
             scraper.scrape(Path("out.json"))
 
+        # Polled for the whole timeout, then gave up
+        assert mock_page.wait_for_timeout.call_count == 300
         mock_pw.stop.assert_called_once()
 
     def test_raises_if_no_chats_fetched(self):
@@ -726,7 +731,7 @@ class TestScrape:
         mock_browser = MagicMock()
         mock_context = MagicMock()
         mock_new_page = MagicMock()
-        mock_new_page.evaluate.side_effect = [
+        mock_new_page.evaluate.return_value = [
             CHATS_STARRED,
             CHATS_UNSTARRED,
         ]
@@ -746,31 +751,172 @@ class TestScrape:
 
         mock_context.new_page.assert_called_once()
         mock_new_page.goto.assert_called_once_with(
-            "https://claude.ai"
+            "https://claude.ai", wait_until="commit"
         )
 
     @patch("builtins.print")
-    def test_waits_for_networkidle(
+    def test_waits_only_until_org_id_seen(
         self, mock_print, tmp_path: Path
     ):
         scraper = ClaudeScraper()
-        scraper._org_id = ORG_UUID
         mock_pw, mock_page = _make_pw_mock(
             starred_chats=CHATS_STARRED,
             unstarred_chats=CHATS_UNSTARRED,
         )
+        org_url = f"https://claude.ai/api/organizations/{ORG_UUID}/chat_conversations"
+        polls = []
+
+        def deliver_response(ms):
+            # Playwright dispatches response events while waiting
+            polls.append(ms)
+            if len(polls) == 3:
+                scraper._handle_response(_mock_response(org_url, []))
+
+        mock_page.wait_for_timeout.side_effect = deliver_response
 
         with patch.object(
             scraper,
             "_start_playwright",
             return_value=mock_pw,
         ):
+            mapping = scraper.scrape(tmp_path / "m.json")
+
+        assert scraper._org_id == ORG_UUID
+        assert polls == [100, 100, 100]
+        assert len(mapping.chats) == 3
+
+
+class TestOrgIdCache:
+    def _write_meta(self, home: Path, saved_at: float) -> Path:
+        path = home / ".acl" / "claude_meta.json"
+        path.parent.mkdir(parents=True)
+        path.write_text(json.dumps({"org_id": ORG_UUID, "saved_at": saved_at}))
+        return path
+
+    def test_no_home_no_cache(self):
+        assert ClaudeScraper()._load_org_id() is None
+
+    def test_missing_file(self, tmp_path: Path):
+        assert ClaudeScraper(home=tmp_path)._load_org_id() is None
+
+    def test_fresh_entry(self, tmp_path: Path):
+        self._write_meta(tmp_path, time.time())
+        assert ClaudeScraper(home=tmp_path)._load_org_id() == ORG_UUID
+
+    def test_stale_entry(self, tmp_path: Path):
+        self._write_meta(tmp_path, time.time() - 2 * 24 * 3600)
+        assert ClaudeScraper(home=tmp_path)._load_org_id() is None
+
+    @pytest.mark.parametrize("content", ["not json", "[]", '{"org_id": 1}'])
+    def test_invalid_file(self, tmp_path: Path, content: str):
+        path = self._write_meta(tmp_path, time.time())
+        path.write_text(content)
+        assert ClaudeScraper(home=tmp_path)._load_org_id() is None
+
+    @patch("builtins.print")
+    def test_scrape_saves_org_id(self, mock_print, tmp_path: Path):
+        scraper = ClaudeScraper(home=tmp_path)
+        scraper._org_id = ORG_UUID
+        mock_pw, _ = _make_pw_mock(
+            starred_chats=CHATS_STARRED,
+            unstarred_chats=CHATS_UNSTARRED,
+        )
+
+        with patch.object(scraper, "_start_playwright", return_value=mock_pw):
             scraper.scrape(tmp_path / "m.json")
 
-        mock_page.wait_for_load_state.assert_called_once_with(
-            "networkidle"
+        assert ClaudeScraper(home=tmp_path)._load_org_id() == ORG_UUID
+
+    @patch("builtins.print")
+    def test_cached_org_id_skips_navigation(self, mock_print, tmp_path: Path):
+        self._write_meta(tmp_path, time.time())
+        scraper = ClaudeScraper(home=tmp_path)
+        mock_pw, mock_page = _make_pw_mock(
+            page_url="https://claude.ai/chat/123",
+            starred_chats=CHATS_STARRED,
+            unstarred_chats=CHATS_UNSTARRED,
         )
 
+        with patch.object(scraper, "_start_playwright", return_value=mock_pw):
+            mapping = scraper.scrape(tmp_path / "m.json")
+
+        mock_page.goto.assert_not_called()
+        mock_page.on.assert_not_called()
+        assert mock_page.evaluate.call_args[0][1][0] == ORG_UUID
+        assert len(mapping.chats) == 3
+
+    @patch("builtins.print")
+    def test_cached_org_id_needs_claude_tab(self, mock_print, tmp_path: Path):
+        self._write_meta(tmp_path, time.time())
+        scraper = ClaudeScraper(home=tmp_path)
+        mock_pw, mock_page = _make_pw_mock(
+            page_url="https://claude.ai.example.com",
+        )
+
+        with (
+            patch.object(scraper, "_start_playwright", return_value=mock_pw),
+            pytest.raises(RuntimeError, match="Could not discover org ID"),
+        ):
+            scraper.scrape(tmp_path / "m.json")
+
+        mock_page.goto.assert_called_once()
+        mock_page.evaluate.assert_not_called()
+
+    @patch("builtins.print")
+    def test_rediscovers_when_cached_org_id_fails(
+        self, mock_print, tmp_path: Path
+    ):
+        self._write_meta(tmp_path, time.time())
+        scraper = ClaudeScraper(home=tmp_path)
+        mock_pw, mock_page = _make_pw_mock()
+        other_org = "aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa"
+        mock_page.evaluate.side_effect = [
+            [[], []],
+            [CHATS_STARRED, CHATS_UNSTARRED],
+        ]
+        mock_page.wait_for_timeout.side_effect = (
+            lambda ms: scraper._handle_response(
+                _mock_response(
+                    f"https://claude.ai/api/organizations/{other_org}/x", {}
+                )
+            )
+        )
+
+        with patch.object(scraper, "_start_playwright", return_value=mock_pw):
+            mapping = scraper.scrape(tmp_path / "m.json")
+
+        mock_page.goto.assert_called_once()
+        assert mock_page.evaluate.call_args_list[0][0][1][0] == ORG_UUID
+        assert mock_page.evaluate.call_args_list[1][0][1][0] == other_org
+        assert len(mapping.chats) == 3
+        assert ClaudeScraper(home=tmp_path)._load_org_id() == other_org
+
+    @patch("builtins.print")
+    def test_rediscovers_when_cached_fetch_raises(
+        self, mock_print, tmp_path: Path
+    ):
+        self._write_meta(tmp_path, time.time())
+        scraper = ClaudeScraper(home=tmp_path)
+        mock_pw, mock_page = _make_pw_mock()
+        mock_page.evaluate.side_effect = [
+            RuntimeError("SyntaxError: Unexpected token '<'"),
+            [CHATS_STARRED, CHATS_UNSTARRED],
+        ]
+        mock_page.wait_for_timeout.side_effect = (
+            lambda ms: scraper._handle_response(
+                _mock_response(
+                    f"https://claude.ai/api/organizations/{ORG_UUID}/x", {}
+                )
+            )
+        )
+
+        with patch.object(scraper, "_start_playwright", return_value=mock_pw):
+            mapping = scraper.scrape(tmp_path / "m.json")
+
+        mock_page.goto.assert_called_once()
+        assert mock_page.evaluate.call_count == 2
+        assert len(mapping.chats) == 3
+
 
 class TestStartPlaywright:
     def test_import_error_when_playwright_missing(self):
@@ -56,7 +56,7 @@ class TestScrapeClaudeCmd:
             runner = CliRunner()
             result = runner.invoke(
                 cli,
-                ["scrape", "claude", "-o", str(output)],
+                ["scrape", "claude", "-o", str(output), "--home", str(tmp_path)],
             )
 
         assert result.exit_code == 0
@@ -66,7 +66,9 @@ class TestScrapeClaudeCmd:
         assert "Other Project" in result.output
         assert "(has instructions)" in result.output
         assert str(output) in result.output
-        mock_scraper_cls.assert_called_once_with(cdp_url="http://localhost:9222")
+        mock_scraper_cls.assert_called_once_with(
+            cdp_url="http://localhost:9222", home=tmp_path
+        )
 
     def test_custom_cdp_url(self, tmp_path: Path):
         output = tmp_path / "mapping.json"
@@ -74,7 +76,9 @@ class TestScrapeClaudeCmd:
 
         with patch(
             "anticlaw.providers.scraper.claude.ClaudeScraper"
-        ) as mock_scraper_cls:
+        ) as mock_scraper_cls, patch(
+            "anticlaw.cli.scraper_cmd.resolve_home", return_value=tmp_path
+        ):
             instance = MagicMock()
             instance.scrape.return_value = mapping
             mock_scraper_cls.return_value = instance
@@ -90,7 +94,9 @@ class TestScrapeClaudeCmd:
             )
 
         assert result.exit_code == 0
-        mock_scraper_cls.assert_called_once_with(cdp_url="http://localhost:9333")
+        mock_scraper_cls.assert_called_once_with(
+            cdp_url="http://localhost:9333", home=tmp_path
+        )
 
     def test_import_error_shows_install_hint(self, tmp_path: Path):
         output = tmp_path / "mapping.json"
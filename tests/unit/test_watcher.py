@@ -1,5 +1,6 @@
 """Tests for anticlaw.daemon.watcher — FileWatcher."""
 
+import sys
 import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -143,6 +144,53 @@ class TestChangeHandler:
         handler.dispatch(event)
 
 
+class TestChangeJournaling:
+    def _event(self, event_type: str, path: Path, is_directory: bool = False, dest=None):
+        event = MagicMock()
+        event.event_type = event_type
+        event.is_directory = is_directory
+        event.src_path = str(path)
+        event.dest_path = str(dest) if dest else ""
+        return event
+
+    def test_records_all_file_types(self, tmp_path: Path):
+        journal = MagicMock()
+        w = FileWatcher(tmp_path, journal=journal)
+        from anticlaw.daemon.watcher import _ChangeHandler
+
+        _ChangeHandler(w).dispatch(self._event("modified", tmp_path / "notes.txt"))
+        journal.record.assert_called_once_with(str(tmp_path / "notes.txt"), False)
+
+    def test_records_both_sides_of_move(self, tmp_path: Path):
+        journal = MagicMock()
+        w = FileWatcher(tmp_path, journal=journal)
+        w._record_change(self._event("moved", tmp_path / "a", True, dest=tmp_path / "b"))
+
+        assert journal.record.call_count == 2
+        journal.record.assert_called_with(str(tmp_path / "b"), True)
+
+    def test_records_directory_modified(self, tmp_path: Path):
+        journal = MagicMock()
+        w = FileWatcher(tmp_path, journal=journal)
+        w._record_change(self._event("modified", tmp_path / "dir", is_directory=True))
+        journal.record.assert_called_once_with(str(tmp_path / "dir"), True)
+
+    def test_skips_opened(self, tmp_path: Path):
+        journal = MagicMock()
+        w = FileWatcher(tmp_path, journal=journal)
+        w._record_change(self._event("opened", tmp_path / "a.md"))
+        journal.record.assert_not_called()
+
+    def test_journal_follows_watcher_lifecycle(self, tmp_path: Path):
+        journal = MagicMock()
+        w = FileWatcher(tmp_path, journal=journal)
+        with patch.dict(sys.modules, {"watchdog": MagicMock(), "watchdog.observers": MagicMock()}):
+            w.start()
+        journal.start.assert_called_once()
+        w.stop()
+        journal.close.assert_called_once()
+
+
 class TestStartStop:
     def test_start_and_stop(self, tmp_path: Path):
         """Start and stop with the real watchdog library (if installed)."""